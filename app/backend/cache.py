@@ -0,0 +1,346 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+import asyncio
+from collections import OrderedDict
+import json
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from app.backend.config import CacheConfig
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded in-process cache with LRU eviction and per-entry TTL.
+
+    Args:
+        maxsize:
+            Maximum number of entries, ``0`` disables caching.
+        ttl:
+            Default time to live of the entry in seconds,
+            :obj:`None` means entries never expire.
+        timer:
+            Function returning current time in seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+
+        self._data: OrderedDict[K, Tuple[V, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        """Return cached value or :obj:`None` if missing or expired."""
+
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is not None:
+                value, expires_at = item
+                if expires_at is None or expires_at > self.timer():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+
+            self.misses += 1
+            return None
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store value, ``ttl`` overrides default time to live."""
+
+        if self.maxsize <= 0:
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self.timer() + ttl
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Remove entry from cache."""
+
+        with self._lock:
+            self._data.pop(key, None)
+
+    def keys(self) -> List[K]:
+        """Return list of cached keys, including expired ones."""
+
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries from cache."""
+
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class CacheBackend(ABC):
+    """Base class for async key-value cache backends.
+
+    Values are JSON compatible objects, keys are strings.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """Return value of the key, :obj:`None` if missing or expired."""
+
+    async def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Return values of given keys, :obj:`None` for missing ones."""
+
+        return [await self.get(key) for key in keys]
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store value of the key, expiring in ``ttl`` seconds if given."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove the key."""
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> None:
+        """Remove all keys starting with ``prefix``."""
+
+
+class MemoryBackend(CacheBackend):
+    """Cache backend storing values in :class:`LRUCache`."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self.cache: LRUCache[str, Any] = LRUCache(maxsize, ttl)
+
+    async def get(self, key: str) -> Any:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        for key in self.cache.keys():
+            if key.startswith(prefix):
+                self.cache.delete(key)
+
+
+class RedisBackend(CacheBackend):
+    """Cache backend speaking Redis protocol.
+
+    Requires ``redis`` package. Any server compatible with Redis
+    protocol can be used, as well as a client stand-in implementing
+    ``get``, ``mget``, ``set``, ``delete`` and ``scan_iter`` coroutines.
+
+    Args:
+        url:
+            Redis server URL, ignored if ``client`` is given.
+        ttl:
+            Default time to live of the entry in seconds.
+        client:
+            Async Redis client.
+    """
+
+    def __init__(
+        self, url: str, ttl: float | None = None, client: Any | None = None
+    ) -> None:
+        if client is None:
+            from redis import asyncio as aioredis
+
+            client = aioredis.from_url(url)
+
+        self.client = client
+        self.ttl = ttl
+
+    async def get(self, key: str) -> Any:
+        value = await self.client.get(key)
+        return None if value is None else json.loads(value)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Any]:
+        values = await self.client.mget(keys) if keys else []
+        return [None if value is None else json.loads(value) for value in values]
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        px = None if ttl is None else int(ttl * 1000)
+        await self.client.set(key, json.dumps(value), px=px)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        async for key in self.client.scan_iter(match=prefix + "*"):
+            await self.client.delete(key)
+
+
+class ReadThroughCache:
+    """Read-through cache with per-key single-flight loading.
+
+    On a miss the value is loaded once, concurrent readers of the same
+    key wait for the pending load instead of hitting the database.
+
+    Args:
+        backend:
+            Storage of cached values.
+        namespace:
+            Prefix prepended to every key.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str) -> None:
+        self.backend = backend
+        self.namespace = namespace
+        self._loading: Dict[str, asyncio.Future] = dict()
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+
+    def key(self, *parts: Any) -> str:
+        """Build namespaced key from parts."""
+
+        return ":".join([self.namespace, *map(str, parts)])
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """Return cached value, call ``loader`` on a miss.
+
+        Loaded value lives for ``ttl`` seconds, backend default if not given.
+        """
+
+        value = await self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        if (future := self._loading.get(key)) is not None:
+            self.waits += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+
+        try:
+            value = await loader()
+            await self.backend.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # mark exception as retrieved if nobody is waiting
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._loading[key]
+
+    async def get_or_load_many(
+        self,
+        keys: Sequence[str],
+        loader: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Return cached values of given keys, call ``loader`` once for the misses.
+
+        ``loader`` receives the missed keys and returns mapping of the found
+        ones to their values. Keys not found are neither cached nor returned.
+        Loads of the batches are not deduplicated with concurrent readers.
+        """
+
+        values = dict()
+        missed = []
+
+        for key, value in zip(keys, await self.backend.get_many(keys)):
+            if value is None:
+                missed.append(key)
+            else:
+                values[key] = value
+
+        self.hits += len(values)
+        self.misses += len(missed)
+
+        if missed:
+            loaded = await loader(missed)
+            for key, value in loaded.items():
+                await self.backend.set(key, value)
+            values.update(loaded)
+
+        return values
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters.
+
+        ``waits`` is the number of reads served by pending load of other reader.
+        """
+
+        return {"hits": self.hits, "misses": self.misses, "waits": self.waits}
+
+    async def invalidate(self, *parts: Any) -> None:
+        """Remove single entry from cache."""
+
+        await self.backend.delete(self.key(*parts))
+
+    async def invalidate_prefix(self, *parts: Any) -> None:
+        """Remove all entries with keys starting from given parts."""
+
+        await self.backend.delete_prefix(self.key(*parts) + ":")
+
+
+def create_cache(config: CacheConfig, namespace: str) -> ReadThroughCache:
+    """Create read-through cache with backend selected by configuration."""
+
+    backend: CacheBackend
+
+    if config.backend == "redis":
+        backend = RedisBackend(config.redis_url, config.ttl)
+    else:
+        backend = MemoryBackend(config.maxsize, config.ttl)
+
+    return ReadThroughCache(backend, namespace)
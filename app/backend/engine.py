@@ -0,0 +1,205 @@
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Tuple,
+    Type,
+)
+
+from sqlalchemy import (
+    create_engine,
+    event,
+    exc,
+)
+from sqlalchemy.engine import (
+    Connection,
+    Engine,
+    ExceptionContext,
+    make_url,
+    URL,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    create_async_engine,
+)
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    NullPool,
+    Pool,
+    QueuePool,
+)
+
+from app.backend.config import DatabaseConfig
+from app.backend.metrics import registry
+
+
+statement_seconds = registry.histogram(
+    "myapi_db_statement_seconds",
+    "Time spent executing SQL statements.",
+    labels=("engine",),
+)
+
+pool_checkouts = registry.counter(
+    "myapi_db_pool_checkouts_total",
+    "Number of connections checked out from the pool.",
+    labels=("engine",),
+)
+
+
+class PoolMetrics:
+    """Connection pool checkout and wait time counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def observe(self, seconds: float, timed_out: bool = False) -> None:
+        """Record single checkout and time spent waiting for it."""
+
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def stats(self, pool: Pool) -> Dict[str, Any]:
+        """Return pool metrics combined with the current pool state."""
+
+        _stats: Dict[str, Any] = dict()
+
+        if isinstance(pool, QueuePool):
+            _stats["size"] = pool.size()
+            _stats["checked_out"] = pool.checkedout()
+            _stats["overflow"] = pool.overflow()
+
+        with self._lock:
+            _stats["checkouts"] = self.checkouts
+            _stats["timeouts"] = self.timeouts
+            _stats["wait_seconds_total"] = self.wait_seconds_total
+            _stats["wait_seconds_max"] = self.wait_seconds_max
+
+        return _stats
+
+
+def timed_pool(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """Create pool class recording checkouts to ``metrics``.
+
+    Metrics are bound to the class, so they survive pool recreation
+    on engine dispose.
+    """
+
+    class TimedPool(base):  # type: ignore[valid-type, misc]
+        def _do_get(self) -> ConnectionPoolEntry:
+            start = time.perf_counter()
+            timed_out = False
+
+            try:
+                return super()._do_get()
+            except exc.TimeoutError:
+                timed_out = True
+                raise
+            finally:
+                metrics.observe(time.perf_counter() - start, timed_out)
+
+    return TimedPool
+
+
+def make_engine(db: DatabaseConfig, metrics: PoolMetrics) -> Engine:
+    """Create sync engine tuned by database configuration."""
+
+    url, kwargs = engine_args(db, db.dsn, metrics)
+    return create_engine(url, **kwargs)
+
+
+def make_async_engine(db: DatabaseConfig, metrics: PoolMetrics) -> AsyncEngine:
+    """Create async engine tuned by database configuration."""
+
+    url, kwargs = engine_args(db, db.get_async_dsn(), metrics)
+    return create_async_engine(url, **kwargs)
+
+
+def engine_args(
+    db: DatabaseConfig, dsn: str, metrics: PoolMetrics
+) -> Tuple[URL, Dict[str, Any]]:
+    """Build engine URL and keyword arguments from database configuration.
+
+    Args:
+        db:
+            Database configuration.
+        dsn:
+            DSN of the engine, either sync or async one.
+        metrics:
+            Counters updated on each connection checkout.
+
+    Returns:
+        Tuple of URL and keyword arguments passed to ``create_engine``.
+    """
+
+    url = make_url(dsn)
+    driver = url.get_driver_name()
+    is_async = driver in ("asyncpg", "aiosqlite")
+
+    kwargs: Dict[str, Any] = {"pool_pre_ping": db.pool_pre_ping}
+    connect_args: Dict[str, Any] = dict()
+
+    if db.pgbouncer:
+        # pooling is delegated to pgbouncer
+        kwargs["poolclass"] = timed_pool(NullPool, metrics)
+
+        if driver == "asyncpg":
+            # prepared statements do not survive transaction pooling
+            url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+            connect_args["statement_cache_size"] = 0
+    else:
+        pool = AsyncAdaptedQueuePool if is_async else QueuePool
+        kwargs["poolclass"] = timed_pool(pool, metrics)
+        kwargs["pool_size"] = db.pool_size
+        kwargs["max_overflow"] = db.max_overflow
+        kwargs["pool_timeout"] = db.pool_timeout
+        kwargs["pool_recycle"] = db.pool_recycle
+
+    if db.statement_timeout is not None:
+        timeout = str(db.statement_timeout)
+
+        if driver == "asyncpg":
+            connect_args["server_settings"] = {"statement_timeout": timeout}
+        elif driver == "psycopg2":
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+
+    if connect_args:
+        kwargs["connect_args"] = connect_args
+
+    return url, kwargs
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Time statements and count pool checkouts of the engine.
+
+    Async engines are instrumented through their ``sync_engine``.
+    """
+
+    # start times keyed by cursor, failed statements are removed in handle_error
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_execute(conn: Connection, cursor: Any, *args: Any) -> None:
+        conn.info.setdefault("query_start", {})[id(cursor)] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_execute(conn: Connection, cursor: Any, *args: Any) -> None:
+        start = conn.info["query_start"].pop(id(cursor))
+        statement_seconds.observe(time.perf_counter() - start, name)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context: ExceptionContext) -> None:
+        conn, execution = context.connection, context.execution_context
+
+        if conn is not None and execution is not None:
+            conn.info.get("query_start", {}).pop(id(execution.cursor), None)
+
+    @event.listens_for(engine, "checkout")
+    def checkout(*args: Any) -> None:
+        pool_checkouts.inc(name)
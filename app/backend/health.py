@@ -0,0 +1,72 @@
+import asyncio
+import time
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+from app.backend.config import config
+from app.backend.session import (
+    ping,
+    warm_up,
+)
+
+
+class CachedProbe:
+    """Health check with the result cached for ``interval`` seconds.
+
+    Concurrent callers wait for the single pending check, so that
+    frequent probes do not multiply the load of the checked service.
+
+    Args:
+        check:
+            Coroutine function returning True if the service is healthy.
+        interval:
+            Number of seconds the result is reused, ``0`` disables caching.
+        timer:
+            Function returning current time in seconds.
+    """
+
+    def __init__(
+        self,
+        check: Callable[[], Awaitable[bool]],
+        interval: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.check = check
+        self.interval = interval
+        self.timer = timer
+
+        self._result: bool | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _cached(self) -> bool | None:
+        if self._result is None or self.timer() - self._checked_at >= self.interval:
+            return None
+        return self._result
+
+    async def __call__(self) -> bool:
+        if (result := self._cached()) is not None:
+            return result
+
+        async with self._lock:
+            # result may be refreshed while waiting for the lock
+            if (result := self._cached()) is not None:
+                return result
+
+            self._result = await self.check()
+            self._checked_at = self.timer()
+
+            return self._result
+
+
+# readiness check of the database
+database_probe = CachedProbe(
+    lambda: ping(config.health.timeout), interval=config.health.interval
+)
+
+# warm-up of the connection pool, retried by readiness check until it succeeds
+warm_up_probe = CachedProbe(
+    lambda: warm_up(config.database.pool_warmup), interval=config.health.interval
+)
@@ -0,0 +1,132 @@
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+    Sequence,
+)
+
+from jose import (
+    jwk,
+    jwt,
+    JWTError,
+)
+from jose.backends.base import Key
+
+from app.backend.config import TokenKeyConfig
+from app.const import TOKEN_ALGORITHM
+
+
+class KeyRing:
+    """JWT signing keys identified by ``kid``.
+
+    Keys are parsed once, so that signing and verification do not parse
+    PEM on every call. Tokens are signed with the active key and verified
+    with the key named in the token header, which lets keys rotate without
+    downtime: publish the new key, switch signing to it, retire the old one
+    once issued tokens expire. If no asymmetric keys are configured,
+    tokens are signed with HS256 and the shared ``secret``.
+
+    Args:
+        keys:
+            Asymmetric keys configuration.
+        kid:
+            ID of the key signing new tokens, the first key
+            with private key is used by default.
+        secret:
+            Shared secret of HS256 tokens without ``kid``,
+            empty string disables them.
+        leeway:
+            Number of seconds of clock skew allowed
+            when validating ``exp``, ``nbf`` and ``iat`` claims.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[TokenKeyConfig],
+        kid: str | None = None,
+        secret: str = "",
+        leeway: float = 0,
+    ) -> None:
+        self.secret = secret
+        self.options = {"leeway": leeway}
+        self.algorithms: Dict[str, str] = dict()
+        self.private_keys: Dict[str, Key] = dict()
+        self.public_keys: Dict[str, Key] = dict()
+
+        for key in keys:
+            self.algorithms[key.kid] = key.algorithm
+
+            if key.private_key is not None:
+                private_key = jwk.construct(key.private_key, key.algorithm)
+                self.private_keys[key.kid] = private_key
+                self.public_keys[key.kid] = private_key.public_key()
+
+            if key.public_key is not None:
+                self.public_keys[key.kid] = jwk.construct(key.public_key, key.algorithm)
+
+            if key.kid not in self.public_keys:
+                raise ValueError(f"Key {key.kid} has neither private nor public key")
+
+        if kid is None and self.private_keys:
+            kid = next(iter(self.private_keys))
+
+        if kid is not None and kid not in self.private_keys:
+            raise ValueError(f"Private key {kid} is not configured")
+
+        self.kid = kid
+        self._jwks = json.dumps(self.jwks()).encode()
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """Sign claims with the active key."""
+
+        if self.kid is None:
+            return jwt.encode(claims, self.secret, algorithm=TOKEN_ALGORITHM)
+
+        return jwt.encode(
+            claims,
+            self.private_keys[self.kid],
+            algorithm=self.algorithms[self.kid],
+            headers={"kid": self.kid},
+        )
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Verify token signature and return its claims.
+
+        Raises:
+            JWTError: Token is malformed, signed with unknown key,
+                signature is invalid or token is expired.
+        """
+
+        kid = jwt.get_unverified_header(token).get("kid")
+
+        if kid is None:
+            if not self.secret:
+                raise JWTError("Token key ID is missing")
+            return jwt.decode(
+                token, self.secret, algorithms=[TOKEN_ALGORITHM], options=self.options
+            )
+
+        if (key := self.public_keys.get(kid)) is None:
+            raise JWTError(f"Unknown token key ID: {kid}")
+
+        return jwt.decode(
+            token, key, algorithms=[self.algorithms[kid]], options=self.options
+        )
+
+    def jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return public keys as JSON Web Key Set."""
+
+        keys = list()
+
+        for kid, key in self.public_keys.items():
+            keys.append(
+                {**key.to_dict(), "kid": kid, "use": "sig", "alg": self.algorithms[kid]}
+            )
+
+        return {"keys": keys}
+
+    def jwks_json(self) -> bytes:
+        """Return serialized JSON Web Key Set, see :meth:`jwks`."""
+
+        return self._jwks
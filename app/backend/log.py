@@ -0,0 +1,16 @@
+import sys
+
+from loguru import logger
+
+from app.backend.config import LoggingConfig
+
+
+def configure_logging(config: LoggingConfig) -> None:
+    """Configure application logger.
+
+    With ``enqueue`` enabled, messages are passed to a background worker
+    writing them to stderr, so that logging does not block the event loop.
+    """
+
+    logger.remove()
+    logger.add(sys.stderr, level=config.level, enqueue=config.enqueue)
@@ -0,0 +1,259 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from bisect import bisect_left
+from contextlib import contextmanager
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+)
+
+from app.backend.config import config
+
+
+Labels = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Metric(ABC):
+    """Base class of the metrics rendered in Prometheus text format.
+
+    Args:
+        name:
+            Metric name.
+        documentation:
+            Help text of the metric.
+        labels:
+            Names of the labels, values are passed on each observation
+            in the same order.
+    """
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.enabled = True
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        return lines + self.samples()
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Return sample lines of the metric."""
+
+    def format_labels(self, values: Labels, **extra: str) -> str:
+        pairs = list(zip(self.labels, values)) + list(extra.items())
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in pairs) + "}"
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[Labels, float] = dict()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            return [
+                f"{self.name}{self.format_labels(labels)} {value}"
+                for labels, value in self._values.items()
+            ]
+
+
+class Histogram(Metric):
+    """Distribution of observed values counted in buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # per label values: counts in buckets (last one is +Inf), sum
+        self._values: Dict[Labels, Tuple[List[int], List[float]]] = dict()
+
+    def observe(self, value: float, *labels: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if labels not in self._values:
+                self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            counts, total = self._values[labels]
+            counts[bisect_left(self.buckets, value)] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observe time spent in the context block, in seconds."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def samples(self) -> List[str]:
+        lines: List[str] = list()
+
+        with self._lock:
+            for labels, (counts, total) in self._values.items():
+                cumulative = 0
+                bounds = [str(b) for b in self.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, counts):
+                    cumulative += count
+                    _labels = self.format_labels(labels, le=bound)
+                    lines += [f"{self.name}_bucket{_labels} {cumulative}"]
+                _labels = self.format_labels(labels)
+                lines += [f"{self.name}_sum{_labels} {total[0]}"]
+                lines += [f"{self.name}_count{_labels} {cumulative}"]
+
+        return lines
+
+
+class Gauge(Metric):
+    """Current values collected by callback on each scrape.
+
+    Callback returns mapping of label values to the metric value.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str],
+        callback: Callable[[], Dict[Labels, float]],
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{self.format_labels(labels)} {value}"
+            for labels, value in self.callback().items()
+        ]
+
+
+class Registry:
+    """Collection of the application metrics.
+
+    Args:
+        enabled:
+            If :obj:`False`, all the registered metrics are no-op.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._metrics: Dict[str, Metric] = dict()
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            metric.enabled = self.enabled
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        metric = Counter(name, documentation, labels)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labels, buckets)
+        self.register(metric)
+        return metric
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str],
+        callback: Callable[[], Dict[Labels, float]],
+    ) -> Gauge:
+        metric = Gauge(name, documentation, labels, callback)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        """Return metrics in Prometheus text exposition format."""
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = list()
+        for metric in metrics:
+            lines += metric.render()
+
+        return "\n".join(lines) + "\n"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def stats_callback(
+    stats: Callable[[], Mapping[str, Any]],
+) -> Callable[[], Dict[Labels, float]]:
+    """Convert ``stats()`` method of the app components to gauge callback.
+
+    Flat dictionaries are labelled by key, nested ones by both keys.
+    """
+
+    def callback() -> Dict[Labels, float]:
+        values: Dict[Labels, float] = dict()
+        for key, value in stats().items():
+            if isinstance(value, dict):
+                for _key, _value in value.items():
+                    values[(key, _key)] = _value
+            else:
+                values[(key,)] = value
+        return values
+
+    return callback
+
+
+registry = Registry(enabled=config.metrics_enabled)
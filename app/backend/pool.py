@@ -0,0 +1,91 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    TypeVar,
+)
+
+
+T = TypeVar("T")
+
+
+class WorkerPool:
+    """Bounded pool running CPU-bound functions off the event loop.
+
+    The number of workers caps the concurrency, all the other submitted
+    calls wait in the executor queue. Executor is created lazily on the
+    first call, so that the pool can be declared at module level.
+
+    Args:
+        kind:
+            Executor type, either ``thread`` or ``process``.
+        max_workers:
+            Maximum number of calls running concurrently.
+    """
+
+    def __init__(self, kind: str, max_workers: int) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor type: {kind}")
+
+        self.kind = kind
+        self.max_workers = max_workers
+
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(self.max_workers)
+            return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run function in the pool and wait for the result."""
+
+        future = self.executor.submit(fn, *args)
+
+        with self._lock:
+            self._in_flight += 1
+
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return pool metrics.
+
+        ``queue_depth`` is the number of submitted calls waiting
+        for a free worker.
+        """
+
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.max_workers),
+                "completed": self._completed,
+            }
+
+    def shutdown(self) -> None:
+        """Shut down executor, it is recreated on the next call."""
+
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
@@ -0,0 +1,125 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+import time
+from typing import (
+    Any,
+    Callable,
+    Tuple,
+)
+
+from app.backend.cache import LRUCache
+from app.backend.config import RateLimitConfig
+
+
+# atomic token bucket update, returns number of seconds to wait as string
+# (Lua numbers are truncated to integers when returned to the client)
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated", now)
+redis.call("PEXPIRE", KEYS[1], math.ceil(capacity / rate * 1000))
+return tostring(wait)
+"""
+
+
+class RateLimiter(ABC):
+    """Base class for token bucket rate limiters.
+
+    Every key has a bucket of ``capacity`` tokens refilled evenly,
+    so that the bucket gets full in ``period`` seconds. Each request
+    takes one token, requests finding the bucket empty are rejected.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str, capacity: int, period: float) -> float:
+        """Take token from the bucket of the key.
+
+        Returns:
+            ``0`` if token is taken, otherwise number of seconds
+            until the next token is available.
+        """
+
+
+class MemoryRateLimiter(RateLimiter):
+    """Rate limiter keeping buckets in process memory.
+
+    Args:
+        maxsize:
+            Maximum number of buckets kept, least recently used are evicted.
+        timer:
+            Function returning current time in seconds.
+    """
+
+    def __init__(self, maxsize: int, timer: Callable[[], float] = time.monotonic):
+        # bucket is full again once it expires, so eviction can't lose tokens
+        self.buckets: LRUCache[str, Tuple[float, float]] = LRUCache(
+            maxsize, timer=timer
+        )
+        self.timer = timer
+
+    async def acquire(self, key: str, capacity: int, period: float) -> float:
+        now = self.timer()
+        rate = capacity / period
+
+        tokens, updated = self.buckets.get(key) or (capacity, now)
+        tokens = min(capacity, tokens + (now - updated) * rate)
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+
+        self.buckets.set(key, (tokens, now), ttl=period)
+        return wait
+
+
+class RedisRateLimiter(RateLimiter):
+    """Rate limiter keeping buckets in Redis, shared between workers.
+
+    Requires ``redis`` package. Any server compatible with Redis
+    protocol and Lua scripting can be used, as well as a client
+    stand-in implementing ``eval`` coroutine.
+
+    Args:
+        url:
+            Redis server URL, ignored if ``client`` is given.
+        client:
+            Async Redis client.
+    """
+
+    def __init__(self, url: str, client: Any | None = None) -> None:
+        if client is None:
+            from redis import asyncio as aioredis
+
+            client = aioredis.from_url(url)
+
+        self.client = client
+
+    async def acquire(self, key: str, capacity: int, period: float) -> float:
+        wait = await self.client.eval(
+            TOKEN_BUCKET_SCRIPT, 1, key, capacity, capacity / period, time.time()
+        )
+        return float(wait)
+
+
+def create_rate_limiter(config: RateLimitConfig) -> RateLimiter:
+    """Create rate limiter with backend selected by configuration."""
+
+    if config.backend == "redis":
+        return RedisRateLimiter(config.redis_url)
+
+    return MemoryRateLimiter(config.maxsize)
@@ -0,0 +1,61 @@
+import csv
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    TypeVar,
+)
+
+
+T = TypeVar("T")
+
+# file formats supported by read_records
+FORMATS = ("csv", "jsonl")
+
+
+def read_records(path: str | Path, fmt: str | None = None) -> Iterator[Dict[str, Any]]:
+    """Read records from CSV or JSON lines file one by one.
+
+    Args:
+        path:
+            Path to the file. CSV file must have a header row.
+        fmt:
+            File format, either ``csv`` or ``jsonl``.
+            Derived from the file extension if not given.
+
+    Yields:
+        Records as dictionaries.
+    """
+
+    path = Path(path)
+    fmt = fmt or path.suffix.lstrip(".").lower()
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown file format: {fmt}")
+
+    with path.open(newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split iterable into lists of ``size`` items, the last one may be shorter."""
+
+    chunk: List[T] = []
+
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
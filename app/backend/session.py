@@ -1,18 +1,160 @@
+import asyncio
 from contextlib import contextmanager
-from typing import Iterator
+import os
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+)
 
-from sqlalchemy import create_engine
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker,
+    AsyncEngine,
+    AsyncSession,
+)
 from sqlalchemy.orm import (
     Session,
     sessionmaker,
 )
 
 from app.backend.config import config
+from app.backend.engine import (
+    instrument_engine,
+    make_async_engine,
+    make_engine,
+    PoolMetrics,
+)
+from app.backend.metrics import (
+    registry,
+    stats_callback,
+)
+
+
+# checkout counters of sync and async connection pools
+pool_metrics = {"sync": PoolMetrics(), "async": PoolMetrics()}
+
+# engines are created on first use, so that importing this module
+# neither connects nor requires valid database configuration
+_engines: Dict[str, Any] = dict()
+_engines_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """Return sync engine, create it on the first call."""
+
+    with _engines_lock:
+        if (engine := _engines.get("sync")) is None:
+            engine = make_engine(config.database, pool_metrics["sync"])
+            if config.metrics_enabled:
+                instrument_engine(engine, "sync")
+            _engines["sync"] = engine
+
+    return engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return async engine, create it on the first call."""
+
+    with _engines_lock:
+        if (engine := _engines.get("async")) is None:
+            engine = make_async_engine(config.database, pool_metrics["async"])
+            if config.metrics_enabled:
+                instrument_engine(engine.sync_engine, "async")
+            _engines["async"] = engine
+
+    return engine
+
+
+def _forget_engines() -> None:
+    # forked process must not reuse connections of the parent,
+    # drop engines without closing them, child creates its own ones
+    global _engines_lock
+
+    _engines.clear()
+    _engines_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_engines)
+
+
+async def warm_up(connections: int) -> bool:
+    """Open ``connections`` pooled connections of the async engine.
+
+    Connections are opened concurrently and returned to the pool,
+    so that the first requests do not pay for connecting.
+
+    Returns:
+        True if all connections were opened successfully.
+    """
+
+    engine = get_async_engine()
+    conns = await asyncio.gather(
+        *[engine.connect().start() for _ in range(connections)],
+        return_exceptions=True,
+    )
+
+    try:
+        for conn in conns:
+            if isinstance(conn, BaseException):
+                raise conn
+            await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.error(f"Database warm-up failed: {e!r}")
+        return False
+    finally:
+        for conn in conns:
+            if not isinstance(conn, BaseException):
+                await conn.close()
+
+    logger.info(f"Database warm-up: {connections} connections opened")
+    return True
+
+
+async def ping(timeout: float) -> bool:
+    """Check that database responds within ``timeout`` seconds."""
 
+    async def execute() -> None:
+        async with AsyncSessionFactory(bind=get_async_engine()) as session:
+            await session.execute(text("SELECT 1"))
 
-# create session factory to generate new database sessions
+    try:
+        await asyncio.wait_for(execute(), timeout)
+    except Exception as e:
+        logger.warning(f"Database ping failed: {e!r}")
+        return False
+
+    return True
+
+
+async def dispose_engines() -> None:
+    """Close pooled connections, engines are recreated on next use."""
+
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+
+    for engine in engines:
+        if isinstance(engine, AsyncEngine):
+            await engine.dispose()
+        else:
+            engine.dispose()
+
+
+# create session factory to generate new database sessions,
+# engine is bound when the session is created
 SessionFactory = sessionmaker(
-    bind=create_engine(config.database.dsn),
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# create session factory to generate new async database sessions
+AsyncSessionFactory = async_sessionmaker(
     autocommit=False,
     autoflush=False,
     expire_on_commit=False,
@@ -26,7 +168,7 @@ def create_session() -> Iterator[Session]:
         Database session.
     """
 
-    session = SessionFactory()
+    session = SessionFactory(bind=get_engine())
 
     try:
         yield session
@@ -47,3 +189,42 @@ def open_session() -> Iterator[Session]:
     """
 
     return create_session()
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Return metrics of sync and async connection pools created so far."""
+
+    return {
+        name: pool_metrics[name].stats(engine.pool)
+        for name, engine in list(_engines.items())
+    }
+
+
+registry.gauge(
+    "myapi_db_pool",
+    "State of the connection pools.",
+    labels=("engine", "stat"),
+    callback=stats_callback(pool_stats),
+)
+
+
+async def create_async_session() -> AsyncIterator[AsyncSession]:
+    """Create new async database session.
+
+    Used as a dependency by API routers, so that database round-trips
+    do not block the event loop.
+
+    Yields:
+        Async database session.
+    """
+
+    session = AsyncSessionFactory(bind=get_async_engine())
+
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
@@ -1,11 +1,21 @@
+import time
+from typing import Set
+
 import click
 
-from app.backend.session import open_session
-from app.schemas.auth import CreateUserSchema
-from app.services.auth import AuthService
+from app.backend.readers import (
+    chunked,
+    FORMATS,
+    read_records,
+)
 from app.version import __version__
 
 
+# Commands import application modules on demand: they build database
+# engine, read configuration and pull in FastAPI, so that commands
+# like ``myapi --version`` start fast and do not need valid settings.
+
+
 @click.group(invoke_without_command=True)
 @click.option("--version", is_flag=True, help="Show package version")
 def main(version: bool) -> None:
@@ -29,9 +39,125 @@ def create_user(name: str, email: str, password: str) -> None:
         myapi --name 'test user' --email test_user@myapi.com --password qwerty
     """
 
+    from app.backend.session import open_session
+    from app.schemas.auth import CreateUserSchema
+    from app.services.auth import AuthService
+
     # initialize user schema
     user = CreateUserSchema(name=name, email=email, password=password)
 
     # write to database
     with open_session() as session:
         AuthService(session).create_user(user)
+
+
+@main.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(FORMATS),
+    default=None,
+    help="File format, derived from extension by default",
+)
+@click.option("--chunk-size", type=int, default=1000, help="Users written at once")
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of hashing processes, MYAPI_HASHING__MAX_WORKERS by default",
+)
+def import_users(
+    path: str, fmt: str | None, chunk_size: int, workers: int | None
+) -> None:
+    """Import users from file.
+
+    Read users (name, email, password) from CSV or JSON lines file,
+    hash passwords in process pool and write users to database in chunks.
+    Existing users are updated.
+
+    \b
+    Examples:
+        myapi import-users users.csv
+        myapi import-users users.jsonl --chunk-size 5000 --workers 8
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from app.backend.config import config
+    from app.backend.session import open_session
+    from app.schemas.auth import CreateUserSchema
+    from app.services.auth import AuthService
+
+    users = (CreateUserSchema(**record) for record in read_records(path, fmt))
+
+    # emails repeated in several chunks are counted once
+    imported: Set[str] = set()
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(workers or config.hashing.max_workers) as executor:
+        for chunk in chunked(users, chunk_size):
+            # every chunk is committed separately
+            with open_session() as session:
+                AuthService(session).import_users(chunk, executor)
+
+            imported.update(user.email for user in chunk)
+            total = len(imported)
+            elapsed = time.perf_counter() - start
+            click.echo(f"{total} users imported, {total / elapsed:.1f} users/s")
+
+
+@main.command()
+@click.option("--revision", type=str, default="head", help="Target revision")
+def migrate(revision: str) -> None:
+    """Upgrade database schema.
+
+    Apply database migrations up to the given revision.
+
+    \b
+    Examples:
+        myapi migrate
+        myapi migrate --revision 0001
+    """
+
+    from alembic import command
+
+    from app.migrations import alembic_config
+
+    command.upgrade(alembic_config(), revision)
+
+
+@main.command()
+@click.option("--movie-id", type=int, default=1, help="Movie ID")
+@click.option("--year", type=int, default=2000, help="Release year")
+@click.option("--rating", type=float, default=8, help="Rating")
+@click.option("--email", type=str, default="user@myapi.com", help="Email")
+@click.option("--analyze", is_flag=True, help="Execute queries and show timings")
+def explain(movie_id: int, year: int, rating: float, email: str, analyze: bool) -> None:
+    """Print query plans of service queries.
+
+    Can be used to check that queries hit the indexes.
+
+    \b
+    Examples:
+        myapi explain --year 2000 --rating 8 --analyze
+    """
+
+    from app.backend.session import open_session
+    from app.services.auth import AuthDataManager
+    from app.services.movies import MovieDataManager
+
+    queries = {
+        "movie": MovieDataManager.select_movie(movie_id),
+        "movies": MovieDataManager.select_movies(year, rating),
+        "user": AuthDataManager.select_user(email),
+    }
+
+    with open_session() as session:
+        manager = MovieDataManager(session)
+
+        for name, stmt in queries.items():
+            click.echo(f"-- {name}")
+            for line in manager.explain(stmt, analyze):
+                click.echo(line)
+            click.echo()
@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import (
+    Dict,
     Final,
     List,
 )
@@ -9,17 +10,52 @@ from typing import (
 OPEN_API_TITLE: Final = "API Hub"
 OPEN_API_DESCRIPTION: Final = "Demo API over Postgres database built with FastAPI."
 
+# Async drivers used to derive async DSN from the sync one
+ASYNC_DRIVERS: Final[Dict[str, str]] = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
 # Authentication service constants
 AUTH_TAGS: Final[List[str | Enum] | None] = ["Authentication"]
 AUTH_URL: Final = "token"
+AUTH_URL_REFRESH: Final = "refresh"
+AUTH_URL_REVOKE: Final = "revoke"
 
 TOKEN_TYPE: Final = "bearer"
 TOKEN_EXPIRE_MINUTES: Final = 60
+REFRESH_TOKEN_EXPIRE_DAYS: Final = 30
 
-# Algorithm used to sign the JWT tokens
+# Algorithm used to sign the JWT tokens with shared secret
 TOKEN_ALGORITHM: Final = "HS256"
 
+# Public keys verifying the JWT tokens
+JWKS_URL: Final = ".well-known/jwks.json"
+
 # Movies service constants
 MOVIES_TAGS: Final[List[str | Enum] | None] = ["Movies"]
 MOVIES_URL: Final = "movies"
 MOVIES_URL_NEW: Final = "new"
+MOVIES_URL_PAGE: Final = "page"
+MOVIES_URL_STREAM: Final = "stream"
+MOVIES_URL_BATCH: Final = "batch"
+
+# Default and maximum number of movies returned in a single page
+MOVIES_PAGE_LIMIT: Final = 100
+MOVIES_PAGE_MAX_LIMIT: Final = 1000
+
+# Number of rows fetched from server side cursor at once when streaming
+MOVIES_STREAM_BATCH: Final = 1000
+
+# Number of rows fetched at once when streaming from table valued functions
+TVF_STREAM_BATCH: Final = 1000
+
+# Health service constants
+HEALTH_TAGS: Final[List[str | Enum] | None] = ["Health"]
+HEALTH_URL: Final = "health"
+HEALTH_URL_LIVE: Final = "live"
+HEALTH_URL_READY: Final = "ready"
+
+# Metrics endpoint
+METRICS_URL: Final = "metrics"
@@ -1,17 +1,109 @@
-import inspect
+from collections import OrderedDict
+import sys
+import threading
+import time
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NoReturn,
+)
 
 from fastapi.exceptions import HTTPException
 from loguru import logger
 
+from app.backend.config import config
 
-def raise_with_log(status_code: int, detail: str) -> None:
-    """Wrapper function for logging and raising exceptions."""
 
-    desc = f"<HTTPException status_code={status_code} detail={detail}>"
-    logger.error(f"{desc} | runner={runner_info()}")
-    raise HTTPException(status_code, detail)
+class ErrorSampler:
+    """Rate limiter of repeated identical errors.
+
+    Identical error is logged at most once per ``interval`` seconds,
+    the number of suppressed duplicates is reported with the next
+    logged one.
+
+    Args:
+        interval:
+            Minimum number of seconds between identical errors logged,
+            ``0`` disables sampling.
+        maxsize:
+            Maximum number of distinct errors tracked.
+        timer:
+            Function returning current time in seconds.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        maxsize: int = 1024,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.interval = interval
+        self.maxsize = maxsize
+        self.timer = timer
+        # error key -> [time when last logged, number of suppressed]
+        self._errors: OrderedDict[Hashable, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sample(self, key: Hashable) -> int | None:
+        """Return number of suppressed duplicates if error should be logged.
+
+        Returns :obj:`None` if error must be suppressed.
+        """
+
+        if self.interval <= 0:
+            return 0
+
+        now = self.timer()
+
+        with self._lock:
+            entry = self._errors.get(key)
+
+            if entry is not None and now - entry[0] < self.interval:
+                entry[1] += 1
+                return None
+
+            suppressed = 0 if entry is None else int(entry[1])
+            self._errors[key] = [now, 0]
+            self._errors.move_to_end(key)
+
+            while len(self._errors) > self.maxsize:
+                self._errors.popitem(last=False)
+
+            return suppressed
+
+
+error_sampler = ErrorSampler(config.logging.error_interval)
+
+
+def raise_with_log(
+    status_code: int, detail: str, headers: Dict[str, str] | None = None
+) -> NoReturn:
+    """Wrapper function for logging and raising exceptions.
+
+    Repeated identical errors are sampled by :data:`error_sampler`.
+    """
+
+    runner = runner_info()
+    suppressed = error_sampler.sample((status_code, detail, runner))
+
+    if suppressed is not None:
+        desc = f"<HTTPException status_code={status_code} detail={detail}>"
+        if suppressed > 0:
+            desc += f" | suppressed={suppressed}"
+        logger.error(f"{desc} | runner={runner}")
+
+    raise HTTPException(status_code, detail, headers)
 
 
 def runner_info() -> str:
-    info = inspect.getframeinfo(inspect.stack()[2][0])
-    return f"{info.filename}:{info.function}:{info.lineno}"
+    """Return location of the function calling :func:`raise_with_log`.
+
+    Reads the frame directly instead of ``inspect.stack()``, which
+    builds frame info and reads source context for the whole stack.
+    """
+
+    frame = sys._getframe(2)
+    code = frame.f_code
+    return f"{code.co_filename}:{code.co_name}:{frame.f_lineno}"
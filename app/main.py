@@ -1,22 +1,74 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 
+from app.backend.config import config
+from app.backend.health import warm_up_probe
+from app.backend.log import configure_logging
+from app.backend.session import dispose_engines
 from app.const import (
     OPEN_API_DESCRIPTION,
     OPEN_API_TITLE,
 )
+from app.middleware import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+)
 from app.routers import (
     auth,
+    health,
+    jwks,
+    metrics,
     movies,
 )
+from app.services.auth import hashing_pool
 from app.version import __version__
 
 
+configure_logging(config.logging)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage database connections and worker pools of the worker process.
+
+    Runs in every worker after fork, so that workers do not share
+    connection pools. Worker is ready once the pool is warmed up,
+    failed warm-up is retried by the readiness check.
+    """
+
+    app.state.ready = await warm_up_probe()
+
+    yield
+
+    app.state.ready = False
+    await dispose_engines()
+    hashing_pool.shutdown()
+
+
 app = FastAPI(
     title=OPEN_API_TITLE,
     description=OPEN_API_DESCRIPTION,
     version=__version__,
     swagger_ui_parameters={"defaultModelsExpandDepth": -1},
+    lifespan=lifespan,
 )
 
 app.include_router(auth.router)
+app.include_router(health.router)
+app.include_router(jwks.router)
 app.include_router(movies.router)
+
+if config.compression.enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config.compression.minimum_size,
+        encodings=config.compression.encodings,
+        gzip_level=config.compression.gzip_level,
+        brotli_quality=config.compression.brotli_quality,
+    )
+
+if config.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
@@ -0,0 +1,254 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Sequence,
+)
+import zlib
+
+from starlette.datastructures import (
+    Headers,
+    MutableHeaders,
+)
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from app.backend.metrics import registry
+
+
+request_seconds = registry.histogram(
+    "myapi_http_request_duration_seconds",
+    "Latency of the HTTP requests.",
+    labels=("method", "route", "status"),
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency of the HTTP requests per route.
+
+    Requests are labelled by route path template rather than actual path,
+    so that the number of series does not depend on path parameters.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # route is set in scope by router on match
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+
+            request_seconds.observe(
+                time.perf_counter() - start, scope["method"], path, str(status_code)
+            )
+
+
+class Compressor(ABC):
+    """Incremental compressor of the response body."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress chunk of the body, may return data buffered so far."""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Return compressed data buffered so far, keeping the stream open."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Return the rest of compressed data, closing the stream."""
+
+
+class GzipCompressor(Compressor):
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor(Compressor):
+    """Brotli compressor, requires ``brotli`` package."""
+
+    def __init__(self, quality: int) -> None:
+        import brotli
+
+        self._compressor: Any = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with brotli or gzip.
+
+    Encoding is negotiated with ``Accept-Encoding`` request header, the first
+    of ``encodings`` accepted by the client is used. Responses smaller than
+    ``minimum_size`` or already encoded are sent as is. Streaming responses
+    are compressed chunk by chunk, so that every chunk is delivered as soon
+    as it is produced. Strong ETags of compressed responses are weakened.
+
+    Args:
+        app:
+            ASGI application.
+        minimum_size:
+            Minimum size of the compressed response body in bytes.
+        encodings:
+            Supported content encodings in order of preference.
+        gzip_level:
+            Compression level of gzip.
+        brotli_quality:
+            Compression quality of brotli.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        encodings: Sequence[str] = ("gzip",),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        factories: Dict[str, Callable[[], Compressor]] = {
+            "br": lambda: BrotliCompressor(brotli_quality),
+            "gzip": lambda: GzipCompressor(gzip_level),
+        }
+
+        if "br" in encodings:
+            # fail on startup rather than on the first request
+            BrotliCompressor(brotli_quality)
+
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressors = {encoding: factories[encoding] for encoding in encodings}
+
+    def negotiate(self, accept_encoding: str) -> str | None:
+        """Return the preferred encoding accepted by the client."""
+
+        accepted = set()
+
+        for item in accept_encoding.split(","):
+            encoding, _, params = item.partition(";")
+            _, _, quality = params.partition("q=")
+
+            try:
+                if quality and float(quality) <= 0:
+                    continue
+            except ValueError:
+                continue
+
+            accepted.add(encoding.strip().lower())
+
+        for encoding in self.compressors:
+            if encoding in accepted or "*" in accepted:
+                return encoding
+
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+        compressor: Compressor | None = None
+        started = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal compressor, started, start_message
+
+            if message["type"] == "http.response.start":
+                # hold headers until the first chunk of body is known
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if not started:
+                started = True
+                headers = MutableHeaders(raw=start_message["headers"])
+
+                if "content-encoding" in headers or (
+                    len(body) < self.minimum_size and not more_body
+                ):
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = self.compressors[encoding]()
+                body = compressor.compress(body)
+                body += compressor.flush() if more_body else compressor.finish()
+
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag is not None and not etag.startswith("W/"):
+                    # compressed body is not byte identical to the tagged one
+                    headers["ETag"] = "W/" + etag
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+
+                await send(start_message)
+                await send({**message, "body": body})
+                return
+
+            if compressor is None:
+                await send(message)
+                return
+
+            body = compressor.compress(body)
+            body += compressor.flush() if more_body else compressor.finish()
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,14 @@
+from pathlib import Path
+
+from alembic.config import Config
+
+
+def alembic_config() -> Config:
+    """Return configuration of database migrations.
+
+    Database DSN is read from application config in ``env.py``.
+    """
+
+    _config = Config()
+    _config.set_main_option("script_location", str(Path(__file__).parent))
+    return _config
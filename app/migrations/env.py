@@ -0,0 +1,47 @@
+from alembic import context
+from sqlalchemy import create_engine
+
+from app.backend.config import config
+
+# import models to register tables in metadata
+from app.models import (  # noqa: F401
+    auth,
+    movies,
+)
+from app.models.base import SQLModel
+
+
+def run_migrations_offline() -> None:
+    """Emit migration SQL to the script output."""
+
+    context.configure(
+        url=config.database.dsn,
+        target_metadata=SQLModel.metadata,
+        include_schemas=True,
+        literal_binds=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations against the database."""
+
+    engine = create_engine(config.database.dsn)
+
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=SQLModel.metadata,
+            include_schemas=True,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,50 @@
+"""Create myapi schema with users and movies tables
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SCHEMA IF NOT EXISTS myapi")
+
+    op.create_table(
+        "users",
+        sa.Column("email", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        schema="myapi",
+    )
+
+    op.create_table(
+        "movies",
+        sa.Column("movie_id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("released", sa.Integer(), nullable=False),
+        sa.Column("rating", sa.Float(), nullable=False),
+        schema="myapi",
+    )
+
+    op.create_index(
+        "ix_movies_released_rating",
+        "movies",
+        ["released", "rating"],
+        schema="myapi",
+        postgresql_include=["movie_id", "title"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_movies_released_rating", table_name="movies", schema="myapi")
+    op.drop_table("movies", schema="myapi")
+    op.drop_table("users", schema="myapi")
@@ -0,0 +1,36 @@
+"""Create refresh tokens table
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "refresh_tokens",
+        sa.Column("token_hash", sa.String(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.Integer(), nullable=False),
+        schema="myapi",
+    )
+
+    op.create_index(
+        "ix_refresh_tokens_email", "refresh_tokens", ["email"], schema="myapi"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_refresh_tokens_email", table_name="refresh_tokens", schema="myapi"
+    )
+    op.drop_table("refresh_tokens", schema="myapi")
@@ -0,0 +1,52 @@
+"""Create catalogue table tracking version of the movies
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "catalogue",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        schema="myapi",
+    )
+
+    op.execute("INSERT INTO myapi.catalogue (name, version) VALUES ('movies', 1)")
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # version is incremented by every statement writing to movies
+    op.execute("""
+        CREATE FUNCTION myapi.bump_movies_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE myapi.catalogue SET version = version + 1 WHERE name = 'movies';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+    op.execute("""
+        CREATE TRIGGER movies_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON myapi.movies
+        FOR EACH STATEMENT EXECUTE FUNCTION myapi.bump_movies_version()
+        """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER movies_version ON myapi.movies")
+        op.execute("DROP FUNCTION myapi.bump_movies_version()")
+
+    op.drop_table("catalogue", schema="myapi")
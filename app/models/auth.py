@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -13,3 +14,18 @@ class UserModel(SQLModel):
     email: Mapped[str] = mapped_column("email", primary_key=True)
     name: Mapped[str] = mapped_column("name")
     hashed_password: Mapped[str] = mapped_column("hashed_password")
+
+
+class RefreshTokenModel(SQLModel):
+    __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # expired tokens are removed per user
+        Index("ix_refresh_tokens_email", "email"),
+        {"schema": "myapi"},
+    )
+
+    # tokens are stored as SHA-256 digests, never in plain text
+    token_hash: Mapped[str] = mapped_column("token_hash", primary_key=True)
+    email: Mapped[str] = mapped_column("email")
+    # expiration time in seconds since epoch
+    expires_at: Mapped[int] = mapped_column("expires_at")
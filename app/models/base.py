@@ -4,6 +4,7 @@ from typing import (
     List,
 )
 
+from sqlalchemy import Column
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -35,6 +36,16 @@ class SQLModel(DeclarativeBase):
 
         return cls.__mapper__.selectable.c.keys()
 
+    @classmethod
+    def columns(cls) -> List[Column]:
+        """Return list of model columns.
+
+        Can be used to select rows as plain tuples, avoiding the cost
+        of ORM instance creation.
+        """
+
+        return list(cls.__mapper__.columns)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to a dictionary."""
 
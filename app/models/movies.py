@@ -1,3 +1,7 @@
+from sqlalchemy import (
+    BigInteger,
+    Index,
+)
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -8,9 +12,27 @@ from app.models.base import SQLModel
 
 class MovieModel(SQLModel):
     __tablename__ = "movies"
-    __table_args__ = {"schema": "myapi"}
+    __table_args__ = (
+        # covers movies lookup by year and rating with index only scan
+        Index(
+            "ix_movies_released_rating",
+            "released",
+            "rating",
+            postgresql_include=["movie_id", "title"],
+        ),
+        {"schema": "myapi"},
+    )
 
     movie_id: Mapped[int] = mapped_column("movie_id", primary_key=True)
     title: Mapped[str] = mapped_column("title")
     released: Mapped[int] = mapped_column("released")
     rating: Mapped[float] = mapped_column("rating")
+
+
+class CatalogueModel(SQLModel):
+    __tablename__ = "catalogue"
+    __table_args__ = {"schema": "myapi"}
+
+    name: Mapped[str] = mapped_column("name", primary_key=True)
+    # incremented on every write to the catalogue, never decreases
+    version: Mapped[int] = mapped_column("version", BigInteger)
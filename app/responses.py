@@ -0,0 +1,34 @@
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from app.schemas.base import dump_json
+
+
+class RawJSONResponse(JSONResponse):
+    """JSON response serializing content without validation.
+
+    Returned by routers serving data read straight from the database,
+    so that FastAPI does not validate it against ``response_model`` again.
+    Content is encoded with :func:`app.schemas.base.dump_json`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+def is_not_modified(request: Request, etag: str | None) -> bool:
+    """Return True if ``If-None-Match`` request header matches ``etag``.
+
+    Tags are compared with weak comparison, as required for ``If-None-Match``.
+    ``*`` is ignored, since ETag is computed before it is known whether
+    the requested resource exists.
+    """
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None or etag is None:
+        return False
+
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in tags
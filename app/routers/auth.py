@@ -1,17 +1,24 @@
 from fastapi import (
     APIRouter,
     Depends,
+    Form,
+    status,
 )
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.backend.session import create_session
+from app.backend.session import create_async_session
 from app.const import (
     AUTH_TAGS,
     AUTH_URL,
+    AUTH_URL_REFRESH,
+    AUTH_URL_REVOKE,
 )
 from app.schemas.auth import TokenSchema
-from app.services.auth import AuthService
+from app.services.auth import (
+    AsyncAuthService,
+    check_login_rate,
+)
 
 
 router = APIRouter(prefix="/" + AUTH_URL, tags=AUTH_TAGS)
@@ -20,16 +27,48 @@ router = APIRouter(prefix="/" + AUTH_URL, tags=AUTH_TAGS)
 @router.post("", response_model=TokenSchema)
 async def authenticate(
     login: OAuth2PasswordRequestForm = Depends(),
-    session: Session = Depends(create_session),
+    _: None = Depends(check_login_rate),
+    session: AsyncSession = Depends(create_async_session),
 ) -> TokenSchema | None:
     """User authentication.
 
+    Attempts are limited per client IP and per username.
+
     Raises:
         HTTPException: 401 Unauthorized
-        HTTPException: 404 Not Found
+        HTTPException: 429 Too Many Requests
 
     Returns:
-        Access token.
+        Access and refresh tokens.
     """
 
-    return AuthService(session).authenticate(login)
+    return await AsyncAuthService(session).authenticate(login)
+
+
+@router.post("/" + AUTH_URL_REFRESH, response_model=TokenSchema)
+async def refresh(
+    refresh_token: str = Form(),
+    session: AsyncSession = Depends(create_async_session),
+) -> TokenSchema:
+    """Exchange refresh token for new access and refresh tokens.
+
+    Refresh token can be used once, the new one is returned instead.
+
+    Raises:
+        HTTPException: 401 Unauthorized
+
+    Returns:
+        Access and refresh tokens.
+    """
+
+    return await AsyncAuthService(session).refresh(refresh_token)
+
+
+@router.post("/" + AUTH_URL_REVOKE, status_code=status.HTTP_204_NO_CONTENT)
+async def revoke(
+    refresh_token: str = Form(),
+    session: AsyncSession = Depends(create_async_session),
+) -> None:
+    """Revoke refresh token."""
+
+    await AsyncAuthService(session).revoke(refresh_token)
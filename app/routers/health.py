@@ -0,0 +1,49 @@
+from fastapi import (
+    APIRouter,
+    Request,
+    status,
+)
+
+from app.backend.health import (
+    database_probe,
+    warm_up_probe,
+)
+from app.const import (
+    HEALTH_TAGS,
+    HEALTH_URL,
+    HEALTH_URL_LIVE,
+    HEALTH_URL_READY,
+)
+from app.exc import raise_with_log
+from app.schemas.health import HealthSchema
+
+
+router = APIRouter(prefix="/" + HEALTH_URL, tags=HEALTH_TAGS)
+
+
+@router.get("/" + HEALTH_URL_LIVE, response_model=HealthSchema)
+async def live() -> HealthSchema:
+    """Check that application process is running."""
+
+    return HealthSchema(status="ok")
+
+
+@router.get("/" + HEALTH_URL_READY, response_model=HealthSchema)
+async def ready(request: Request) -> HealthSchema:
+    """Check that application is ready to serve requests.
+
+    Application is ready once database connections are warmed up
+    and database responds. Warm-up failed on startup (e.g. database
+    was not reachable yet) is retried. Results of the checks are cached.
+    """
+
+    if not getattr(request.app.state, "ready", False):
+        request.app.state.ready = await warm_up_probe()
+
+    if not request.app.state.ready:
+        raise_with_log(status.HTTP_503_SERVICE_UNAVAILABLE, "Not ready")
+
+    if not await database_probe():
+        raise_with_log(status.HTTP_503_SERVICE_UNAVAILABLE, "Database unavailable")
+
+    return HealthSchema(status="ok")
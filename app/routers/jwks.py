@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.const import (
+    AUTH_TAGS,
+    JWKS_URL,
+)
+from app.services.auth import key_ring
+
+
+router = APIRouter(tags=AUTH_TAGS)
+
+
+@router.get("/" + JWKS_URL)
+async def get_jwks() -> Response:
+    """Public keys verifying access tokens as JSON Web Key Set."""
+
+    return Response(
+        key_ring.jwks_json(),
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
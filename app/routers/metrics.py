@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.backend.metrics import registry
+from app.const import METRICS_URL
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/" + METRICS_URL, response_class=PlainTextResponse, include_in_schema=False
+)
+async def get_metrics() -> PlainTextResponse:
+    """Expose metrics in Prometheus text format."""
+
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
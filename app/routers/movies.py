@@ -1,44 +1,185 @@
-from typing import List
+from typing import (
+    Dict,
+    List,
+)
 
 from fastapi import (
     APIRouter,
     Depends,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import (
+    Response,
+    StreamingResponse,
 )
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.backend.session import create_session
+from app.backend.config import config
+from app.backend.session import create_async_session
 from app.const import (
+    MOVIES_PAGE_LIMIT,
+    MOVIES_PAGE_MAX_LIMIT,
     MOVIES_TAGS,
     MOVIES_URL,
+    MOVIES_URL_BATCH,
     MOVIES_URL_NEW,
+    MOVIES_URL_PAGE,
+    MOVIES_URL_STREAM,
+)
+from app.responses import (
+    is_not_modified,
+    RawJSONResponse,
 )
 from app.schemas.auth import UserSchema
-from app.schemas.movies import MovieSchema
+from app.schemas.movies import (
+    MovieBatchSchema,
+    MoviePageSchema,
+    MovieSchema,
+)
 from app.services.auth import get_current_user
-from app.services.movies import MovieService
+from app.services.movies import (
+    AsyncMovieService,
+    batch_ids,
+)
 
 
 router = APIRouter(prefix="/" + MOVIES_URL, tags=MOVIES_TAGS)
 
+# Cache-Control of the responses per route, overridden by config
+CACHE_CONTROL: Dict[str, str] = {
+    "get_movie": "private, max-age=300",
+    "get_movies_batch": "private, max-age=300",
+    "get_movies": "private, max-age=60",
+    "get_movies_page": "private, max-age=60",
+}
+
+
+async def cache_headers(
+    request: Request, service: AsyncMovieService, route: str
+) -> Dict[str, str]:
+    """Return ``ETag`` and ``Cache-Control`` headers of the route response.
+
+    ``ETag`` is omitted if catalogue version is not tracked.
+    """
+
+    headers = {
+        "Cache-Control": config.movies_cache_control.get(route, CACHE_CONTROL[route])
+    }
+
+    etag = await service.get_etag(request.url.path, request.url.query)
+    if etag is not None:
+        headers["ETag"] = etag
+
+    return headers
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
 
 @router.get("/", response_model=MovieSchema)
 async def get_movie(
+    request: Request,
     movie_id: int,
     user: UserSchema = Depends(get_current_user),
-    session: Session = Depends(create_session),
-) -> MovieSchema:
+    session: AsyncSession = Depends(create_async_session),
+) -> Response:
     """Get movie by ID."""
 
-    return MovieService(session).get_movie(movie_id)
+    service = AsyncMovieService(session)
+    headers = await cache_headers(request, service, "get_movie")
+
+    if is_not_modified(request, headers.get("ETag")):
+        return not_modified(headers)
+
+    return RawJSONResponse(await service.get_movie(movie_id), headers=headers)
+
+
+@router.get("/" + MOVIES_URL_BATCH, response_model=MovieBatchSchema)
+async def get_movies_batch(
+    request: Request,
+    movie_id: List[int] = Query(),
+    user: UserSchema = Depends(get_current_user),
+    session: AsyncSession = Depends(create_async_session),
+) -> Response:
+    """Get movies by list of IDs.
+
+    Pass ``movie_id`` parameter once per movie. Movies are returned in the
+    requested order, IDs of the movies not found are listed in ``missing``.
+    """
+
+    # rejected before conditional request is answered
+    movie_id = batch_ids(movie_id)
+
+    service = AsyncMovieService(session)
+    headers = await cache_headers(request, service, "get_movies_batch")
+
+    if is_not_modified(request, headers.get("ETag")):
+        return not_modified(headers)
+
+    batch = await service.get_movies_batch(movie_id)
+    return RawJSONResponse(batch, headers=headers)
 
 
 @router.get("/" + MOVIES_URL_NEW, response_model=List[MovieSchema])
 async def get_movies(
+    request: Request,
     year: int,
     rating: float,
     user: UserSchema = Depends(get_current_user),
-    session: Session = Depends(create_session),
-) -> List[MovieSchema]:
+    session: AsyncSession = Depends(create_async_session),
+) -> Response:
     """Get movies by ``year`` and ``rating``."""
 
-    return MovieService(session).get_movies(year, rating)
+    service = AsyncMovieService(session)
+    headers = await cache_headers(request, service, "get_movies")
+
+    if is_not_modified(request, headers.get("ETag")):
+        return not_modified(headers)
+
+    return RawJSONResponse(await service.get_movies(year, rating), headers=headers)
+
+
+@router.get(
+    "/" + MOVIES_URL_NEW + "/" + MOVIES_URL_PAGE, response_model=MoviePageSchema
+)
+async def get_movies_page(
+    request: Request,
+    year: int,
+    rating: float,
+    limit: int = Query(MOVIES_PAGE_LIMIT, ge=1, le=MOVIES_PAGE_MAX_LIMIT),
+    after: int | None = None,
+    user: UserSchema = Depends(get_current_user),
+    session: AsyncSession = Depends(create_async_session),
+) -> Response:
+    """Get page of movies by ``year`` and ``rating``.
+
+    Movies are ordered by ID. Pass ``next_cursor`` of the response
+    as ``after`` parameter to get the next page.
+    """
+
+    service = AsyncMovieService(session)
+    headers = await cache_headers(request, service, "get_movies_page")
+
+    if is_not_modified(request, headers.get("ETag")):
+        return not_modified(headers)
+
+    page = await service.get_movies_page(year, rating, limit, after)
+    return RawJSONResponse(page, headers=headers)
+
+
+@router.get("/" + MOVIES_URL_NEW + "/" + MOVIES_URL_STREAM)
+async def stream_movies(
+    year: int,
+    rating: float,
+    user: UserSchema = Depends(get_current_user),
+    session: AsyncSession = Depends(create_async_session),
+) -> StreamingResponse:
+    """Stream movies by ``year`` and ``rating`` as newline delimited JSON."""
+
+    return StreamingResponse(
+        AsyncMovieService(session).stream_movies(year, rating),
+        media_type="application/x-ndjson",
+    )
@@ -16,3 +16,4 @@ class UserSchema(BaseSchema):
 class TokenSchema(BaseSchema):
     access_token: str
     token_type: str
+    refresh_token: str | None = None
@@ -1,8 +1,35 @@
+from typing import Any
+
 from pydantic import (
     BaseModel,
     ConfigDict,
+    TypeAdapter,
 )
+from pydantic_core import to_jsonable_python
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 
 class BaseSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
+
+
+# serializes JSON compatible objects without validating them
+json_adapter: TypeAdapter[Any] = TypeAdapter(Any)
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize JSON compatible object without validating it.
+
+    Uses ``orjson`` if installed, which encodes lists of plain dictionaries
+    several times faster, and falls back to :data:`json_adapter` otherwise.
+    Types not supported by ``orjson`` are converted the way pydantic does.
+    """
+
+    if orjson is None:
+        return json_adapter.dump_json(content)
+    return orjson.dumps(content, default=to_jsonable_python)
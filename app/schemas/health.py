@@ -0,0 +1,5 @@
+from app.schemas.base import BaseSchema
+
+
+class HealthSchema(BaseSchema):
+    status: str
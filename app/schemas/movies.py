@@ -1,3 +1,9 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
 from app.schemas.base import BaseSchema
 
 
@@ -6,3 +12,19 @@ class MovieSchema(BaseSchema):
     title: str
     released: int
     rating: float
+
+
+class MoviePageSchema(BaseSchema):
+    movies: List[MovieSchema]
+    next_cursor: int | None = None
+
+
+class MovieBatchSchema(BaseSchema):
+    movies: List[MovieSchema]
+    missing: List[int]
+
+
+# movies read from database as plain dictionaries with fields of the schemas above
+MovieDict = Dict[str, Any]
+MoviePageDict = Dict[str, Any]
+MovieBatchDict = Dict[str, Any]
@@ -1,47 +1,134 @@
-from datetime import (
-    datetime,
-    timedelta,
+from concurrent.futures import Executor
+from datetime import datetime
+import hashlib
+import math
+import secrets
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Sequence,
+    Tuple,
 )
 
 from fastapi import (
     Depends,
+    Request,
     status,
 )
 from fastapi.security import (
     OAuth2PasswordBearer,
     OAuth2PasswordRequestForm,
 )
-from jose import (
-    jwt,
-    JWTError,
-)
+from jose import JWTError
+from jose.exceptions import ExpiredSignatureError
 from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import (
+    delete,
+    Delete,
+    select,
+    Select,
+    update,
+    Update,
+)
+from sqlalchemy.sql.dml import ReturningDelete
 
+from app.backend.cache import LRUCache
 from app.backend.config import config
+from app.backend.keys import KeyRing
+from app.backend.metrics import (
+    registry,
+    stats_callback,
+)
+from app.backend.pool import WorkerPool
+from app.backend.ratelimit import create_rate_limiter
 from app.const import (
     AUTH_URL,
-    TOKEN_ALGORITHM,
-    TOKEN_EXPIRE_MINUTES,
     TOKEN_TYPE,
 )
 from app.exc import raise_with_log
-from app.models.auth import UserModel
+from app.models.auth import (
+    RefreshTokenModel,
+    UserModel,
+)
 from app.schemas.auth import (
     CreateUserSchema,
     TokenSchema,
     UserSchema,
 )
 from app.services.base import (
+    AsyncBaseDataManager,
+    AsyncBaseService,
     BaseDataManager,
     BaseService,
 )
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# hashes of all but the first scheme are deprecated and replaced on login
+pwd_context = CryptContext(
+    schemes=config.hashing.schemes, deprecated="auto", **config.hashing.settings
+)
+
+# worker pool used to hash and verify passwords off the event loop
+hashing_pool = WorkerPool(config.hashing.executor, config.hashing.max_workers)
+
+# parsed keys signing and verifying tokens
+key_ring = KeyRing(
+    config.token_keys, config.token_kid, config.token_key, leeway=config.token_leeway
+)
+
+# token buckets of login attempts per client IP and per username
+login_limiter = create_rate_limiter(config.rate_limit)
 
 oauth2_schema = OAuth2PasswordBearer(tokenUrl=AUTH_URL, auto_error=False)
 
+# decoded users of verified tokens, entries are evicted at token expiration
+token_cache: LRUCache[str, UserSchema] = LRUCache(config.token_cache_size)
+
+# emails not found in database, looked up again once entries expire;
+# it saves queries for repeated emails only, distinct emails (e.g. an
+# enumeration attempt) each reach the database and evict older entries
+unknown_users: LRUCache[str, bool] = LRUCache(
+    config.unknown_user_cache_size, ttl=config.unknown_user_ttl
+)
+
+# same response for unknown users and wrong passwords
+INCORRECT_LOGIN = "Incorrect username or password"
+
+auth_seconds = registry.histogram(
+    "myapi_auth_seconds",
+    "Time spent on token verification and password hashing.",
+    labels=("operation",),
+)
+
+login_rejected = registry.counter(
+    "myapi_login_rate_limited_total",
+    "Number of login attempts rejected by rate limiter.",
+    labels=("scope",),
+)
+
+registry.gauge(
+    "myapi_hashing_pool",
+    "State of the password hashing pool.",
+    labels=("stat",),
+    callback=stats_callback(hashing_pool.stats),
+)
+
+registry.gauge(
+    "myapi_unknown_users_cache",
+    "State of the unknown users cache.",
+    labels=("stat",),
+    callback=stats_callback(unknown_users.stats),
+)
+
+registry.gauge(
+    "myapi_token_cache",
+    "State of the verified tokens cache.",
+    labels=("stat",),
+    callback=stats_callback(token_cache.stats),
+)
+
 
 async def get_current_user(token: str = Depends(oauth2_schema)) -> UserSchema | None:
     """Decode token to obtain user information.
@@ -58,54 +145,319 @@ async def get_current_user(token: str = Depends(oauth2_schema)) -> UserSchema |
         Decoded user dictionary.
     """
 
+    with auth_seconds.time("get_current_user"):
+        return decode_user(token)
+
+
+async def check_login_rate(
+    request: Request, login: OAuth2PasswordRequestForm = Depends()
+) -> None:
+    """Reject login attempt if client IP or username is throttled.
+
+    Used as a dependency of the login router, so that throttled attempts
+    are rejected before user lookup and password verification.
+    """
+
+    limits = config.rate_limit
+    client = request.client.host if request.client is not None else "unknown"
+
+    buckets = (
+        ("ip", client, limits.ip_attempts),
+        ("username", login.username.lower(), limits.username_attempts),
+    )
+
+    for scope, value, attempts in buckets:
+        if attempts <= 0:
+            continue
+
+        key = f"login:{scope}:{value}"
+        if (wait := await login_limiter.acquire(key, attempts, limits.period)) > 0:
+            login_rejected.inc(scope)
+            raise_with_log(
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                "Too many login attempts",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+
+
+def decode_user(token: str) -> UserSchema | None:
+    """Decode token to obtain user information, see :func:`get_current_user`."""
+
     if token is None:
         raise_with_log(status.HTTP_401_UNAUTHORIZED, "Invalid token")
 
+    # token has been verified recently and is not expired yet
+    key = token_digest(token)
+    if (user := token_cache.get(key)) is not None:
+        return user
+
     try:
-        # decode token using secret token key provided by config
-        payload = jwt.decode(token, config.token_key, algorithms=[TOKEN_ALGORITHM])
+        # verify token with the key named in its header,
+        # standard time claims (exp, nbf, iat) are validated with leeway
+        payload: Any = key_ring.decode(token)
 
         # extract encoded information
         name: str = payload.get("name")
         sub: str = payload.get("sub")
-        expires_at: str = payload.get("expires_at")
 
         if sub is None:
             raise_with_log(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
 
-        if is_expired(expires_at):
+        expires_in = time_to_expire(payload)
+        if expires_in < 0:
             raise_with_log(status.HTTP_401_UNAUTHORIZED, "Token expired")
 
-        return UserSchema(name=name, email=sub)
+        user = UserSchema(name=name, email=sub)
+        token_cache.set(key, user, ttl=expires_in)
+
+        return user
+    except ExpiredSignatureError:
+        raise_with_log(status.HTTP_401_UNAUTHORIZED, "Token expired")
     except JWTError:
         raise_with_log(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
 
     return None
 
 
-def is_expired(expires_at: str) -> bool:
-    """Return :obj:`True` if token has expired."""
+def time_to_expire(payload: Dict[str, Any]) -> float:
+    """Return number of seconds left until token expires, leeway included.
+
+    Tokens issued before the ``exp`` claim was introduced carry expiration
+    time as ``expires_at`` string, they are accepted while
+    ``config.token_legacy`` is enabled.
+
+    Raises:
+        JWTError: Expiration time is missing.
+    """
+
+    if (exp := payload.get("exp")) is not None:
+        return float(exp) + config.token_leeway - time.time()
+
+    if config.token_legacy and (expires_at := payload.get("expires_at")) is not None:
+        expires = datetime.strptime(expires_at, "%Y-%m-%d %H:%M:%S")
+        return (expires - datetime.utcnow()).total_seconds()
+
+    raise JWTError("Token expiration time is missing")
+
 
-    return datetime.strptime(expires_at, "%Y-%m-%d %H:%M:%S") < datetime.utcnow()
+def token_digest(token: str) -> str:
+    """Return token hash used as a key in :data:`token_cache`."""
+
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def hash_password(password: str) -> str:
+    """Hash password with the configured scheme."""
+
+    return pwd_context.hash(password)
+
+
+# hash of random password verified for unknown users, see dummy_hash
+_dummy_hash = ""
+
+
+def dummy_hash() -> str:
+    """Return hash of random password verified for unknown users.
+
+    Password is hashed on the first call.
+    """
+
+    global _dummy_hash
+
+    if not _dummy_hash:
+        _dummy_hash = hash_password(secrets.token_urlsafe(32))
+    return _dummy_hash
+
+
+async def dummy_hash_async() -> str:
+    """Return :func:`dummy_hash`, hashing password in worker pool.
+
+    Hashing on the first call would block the event loop otherwise.
+    """
+
+    global _dummy_hash
+
+    if not _dummy_hash:
+        password = secrets.token_urlsafe(32)
+        _dummy_hash = await hashing_pool.run(hash_password, password)
+    return _dummy_hash
+
+
+def verify_password(hashed_password: str, plain_password: str) -> bool:
+    """Verify a password against a hash."""
+
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    hashed_password: str, plain_password: str
+) -> Tuple[bool, str | None]:
+    """Verify a password against a hash, rehash it if hash is outdated.
+
+    Returns:
+        Verification result and new hash of the password if the given one
+        uses deprecated scheme or cost parameters, otherwise :obj:`None`.
+    """
+
+    return pwd_context.verify_and_update(plain_password, hashed_password)
 
 
 class HashingMixin:
-    """Hashing and verifying passwords."""
+    """Hashing and verifying passwords.
+
+    Async methods run hashing in :data:`hashing_pool`, so that hashing
+    does not block the event loop.
+    """
 
     @staticmethod
-    def bcrypt(password: str) -> str:
-        """Generate a bcrypt hashed password."""
+    def hash(password: str) -> str:
+        """Hash password with the configured scheme."""
 
-        return pwd_context.hash(password)
+        with auth_seconds.time("hash"):
+            return hash_password(password)
 
     @staticmethod
     def verify(hashed_password: str, plain_password: str) -> bool:
         """Verify a password against a hash."""
 
-        return pwd_context.verify(plain_password, hashed_password)
+        with auth_seconds.time("verify"):
+            return verify_password(hashed_password, plain_password)
+
+    @staticmethod
+    async def hash_async(password: str) -> str:
+        """Hash password with the configured scheme in worker pool."""
+
+        with auth_seconds.time("hash"):
+            return await hashing_pool.run(hash_password, password)
+
+    @staticmethod
+    async def verify_async(hashed_password: str, plain_password: str) -> bool:
+        """Verify a password against a hash in worker pool.
+
+        Measured time includes waiting for a free worker.
+        """
+
+        with auth_seconds.time("verify"):
+            return await hashing_pool.run(
+                verify_password, hashed_password, plain_password
+            )
+
+    @staticmethod
+    def verify_and_update(
+        hashed_password: str, plain_password: str
+    ) -> Tuple[bool, str | None]:
+        """Verify a password against a hash, rehash it if hash is outdated."""
+
+        with auth_seconds.time("verify"):
+            return verify_and_update_password(hashed_password, plain_password)
+
+    @staticmethod
+    async def verify_and_update_async(
+        hashed_password: str, plain_password: str
+    ) -> Tuple[bool, str | None]:
+        """Verify a password against a hash in worker pool, rehash if outdated."""
+
+        with auth_seconds.time("verify"):
+            return await hashing_pool.run(
+                verify_and_update_password, hashed_password, plain_password
+            )
+
+    # former names, hashing is not bound to bcrypt
+    bcrypt = hash
+    bcrypt_async = hash_async
+
+
+class TokenMixin(HashingMixin):
+    """Verifying user credentials and issuing access tokens."""
+
+    def _verify_login(
+        self, user: UserSchema | None, password: str
+    ) -> Tuple[UserSchema, str | None]:
+        """Verify password against hashed password.
+
+        Unknown user is verified against :func:`dummy_hash`, so that
+        rejection costs the same as a wrong password and the response
+        does not tell whether the account exists. This includes users
+        found in :data:`unknown_users` without a database lookup.
+
+        Returns:
+            Verified user and new hash of the password if the stored one
+            is outdated, otherwise :obj:`None`.
+        """
+
+        if user is None or user.hashed_password is None:
+            self.verify(dummy_hash(), password)
+            raise_with_log(status.HTTP_401_UNAUTHORIZED, INCORRECT_LOGIN)
+
+        valid, new_hash = self.verify_and_update(user.hashed_password, password)
+        return self._verified(user, valid, new_hash)
+
+    async def _verify_login_async(
+        self, user: UserSchema | None, password: str
+    ) -> Tuple[UserSchema, str | None]:
+        """Verify password in worker pool, see :meth:`_verify_login`."""
+
+        if user is None or user.hashed_password is None:
+            await self.verify_async(await dummy_hash_async(), password)
+            raise_with_log(status.HTTP_401_UNAUTHORIZED, INCORRECT_LOGIN)
+
+        valid, new_hash = await self.verify_and_update_async(
+            user.hashed_password, password
+        )
+        return self._verified(user, valid, new_hash)
+
+    @staticmethod
+    def _verified(
+        user: UserSchema, valid: bool, new_hash: str | None
+    ) -> Tuple[UserSchema, str | None]:
+        if not valid:
+            raise_with_log(status.HTTP_401_UNAUTHORIZED, INCORRECT_LOGIN)
+
+        return user, new_hash
+
+    def _issue_token(self, user: UserSchema) -> TokenSchema:
+        """Generate access token for authenticated user."""
+
+        access_token = self._create_access_token(user.name, user.email)
+        return TokenSchema(access_token=access_token, token_type=TOKEN_TYPE)
+
+    def _create_access_token(self, name: str, email: str) -> str:
+        """Encode user information and token lifetime.
+
+        Lifetime is encoded as standard numeric claims (seconds since epoch):
+        ``iat`` issue time, ``nbf`` start and ``exp`` end of validity.
+        """
+
+        now = int(time.time())
 
+        payload = {
+            "name": name,
+            "sub": email,
+            "iat": now,
+            "nbf": now,
+            "exp": now + config.token_expire_minutes * 60,
+        }
 
-class AuthService(HashingMixin, BaseService):
+        return key_ring.encode(payload)
+
+    @staticmethod
+    def _create_refresh_token(email: str) -> Tuple[str, RefreshTokenModel]:
+        """Generate random refresh token and its database record.
+
+        Token is random, so that fast SHA-256 digest is enough to store it.
+        """
+
+        refresh_token = secrets.token_urlsafe(32)
+        expires_at = int(time.time()) + config.refresh_token_expire_days * 86400
+
+        model = RefreshTokenModel(
+            token_hash=token_digest(refresh_token), email=email, expires_at=expires_at
+        )
+
+        return refresh_token, model
+
+
+class AuthService(TokenMixin, BaseService):
     """Authentication service."""
 
     def create_user(self, user: CreateUserSchema) -> None:
@@ -114,11 +466,43 @@ class AuthService(HashingMixin, BaseService):
         user_model = UserModel(
             name=user.name,
             email=user.email,
-            hashed_password=self.bcrypt(user.password),
+            hashed_password=self.hash(user.password),
         )
 
         AuthDataManager(self.session).add_user(user_model)
 
+    def import_users(
+        self, users: Sequence[CreateUserSchema], executor: Executor | None = None
+    ) -> int:
+        """Add users to database, update the existing ones.
+
+        Passwords are hashed in ``executor`` (a process pool spreads hashing
+        across cores), or serially if it is not given. If email occurs
+        several times, the last user wins.
+
+        Returns:
+            Number of users written.
+        """
+
+        # deduplicate emails, conflicting rows can't be upserted in one statement
+        by_email = {user.email: user for user in users}
+        passwords = [user.password for user in by_email.values()]
+
+        hashed: Iterable[str]
+
+        if executor is None:
+            hashed = map(hash_password, passwords)
+        else:
+            hashed = executor.map(hash_password, passwords)
+
+        rows = [
+            {"name": user.name, "email": user.email, "hashed_password": password}
+            for user, password in zip(by_email.values(), hashed)
+        ]
+
+        AuthDataManager(self.session).add_users(rows)
+        return len(rows)
+
     def authenticate(
         self, login: OAuth2PasswordRequestForm = Depends()
     ) -> TokenSchema | None:
@@ -127,50 +511,124 @@ class AuthService(HashingMixin, BaseService):
         Obtains username and password and verifies password against
         hashed password stored in database. If valid then temporary
         token is generated, otherwise the corresponding exception is raised.
+        Password hashed with deprecated scheme or cost is rehashed.
         """
 
-        user = AuthDataManager(self.session).get_user(login.username)
+        manager = AuthDataManager(self.session)
+        user, new_hash = self._verify_login(
+            manager.find_user(login.username), login.password
+        )
 
-        if user.hashed_password is None:
-            raise_with_log(status.HTTP_401_UNAUTHORIZED, "Incorrect password")
-        else:
-            if not self.verify(user.hashed_password, login.password):
-                raise_with_log(status.HTTP_401_UNAUTHORIZED, "Incorrect password")
-            else:
-                access_token = self._create_access_token(user.name, user.email)
-                return TokenSchema(access_token=access_token, token_type=TOKEN_TYPE)
-        return None
+        if new_hash is not None:
+            manager.set_password(user.email, new_hash)
 
-    def _create_access_token(self, name: str, email: str) -> str:
-        """Encode user information and expiration time."""
+        return self._issue_token(user)
 
-        payload = {
-            "name": name,
-            "sub": email,
-            "expires_at": self._expiration_time(),
-        }
 
-        return jwt.encode(payload, config.token_key, algorithm=TOKEN_ALGORITHM)
+class AsyncAuthService(TokenMixin, AsyncBaseService):
+    """Async authentication service."""
 
-    @staticmethod
-    def _expiration_time() -> str:
-        """Get token expiration time."""
+    async def authenticate(
+        self, login: OAuth2PasswordRequestForm = Depends()
+    ) -> TokenSchema | None:
+        """Generate token.
 
-        expires_at = datetime.utcnow() + timedelta(minutes=TOKEN_EXPIRE_MINUTES)
-        return expires_at.strftime("%Y-%m-%d %H:%M:%S")
+        See :meth:`AuthService.authenticate` for details. Refresh token
+        is issued along with the access token.
+        """
 
+        manager = AsyncAuthDataManager(self.session)
+        user, new_hash = await self._verify_login_async(
+            await manager.find_user(login.username), login.password
+        )
 
-class AuthDataManager(BaseDataManager):
-    def add_user(self, user: UserModel) -> None:
-        """Write user to database."""
+        if new_hash is not None:
+            await manager.set_password(user.email, new_hash)
 
-        self.add_one(user)
+        token = self._issue_token(user)
+        token.refresh_token = await self._add_refresh_token(user.email)
 
-    def get_user(self, email: str) -> UserSchema:
-        """Read user from database."""
+        return token
+
+    async def refresh(self, refresh_token: str) -> TokenSchema:
+        """Exchange refresh token for new access and refresh tokens.
+
+        Refresh token is single use, it is removed from database on exchange.
+        Password is not verified, so that the exchange is cheap.
+        """
+
+        manager = AsyncAuthDataManager(self.session)
+
+        email = await manager.pop_refresh_token(token_digest(refresh_token))
+        if email is None:
+            raise_with_log(status.HTTP_401_UNAUTHORIZED, "Invalid refresh token")
+
+        token = self._issue_token(await manager.get_user(email))
+        token.refresh_token = await self._add_refresh_token(email)
+
+        return token
+
+    async def revoke(self, refresh_token: str) -> None:
+        """Revoke refresh token."""
+
+        await AsyncAuthDataManager(self.session).remove_refresh_token(
+            token_digest(refresh_token)
+        )
+
+    async def _add_refresh_token(self, email: str) -> str | None:
+        """Generate refresh token and write its digest to database."""
+
+        if config.refresh_token_expire_days <= 0:
+            return None
+
+        refresh_token, model = self._create_refresh_token(email)
+
+        manager = AsyncAuthDataManager(self.session)
+        await manager.remove_expired_refresh_tokens(email, int(time.time()))
+        await manager.add_refresh_token(model)
+
+        return refresh_token
+
+
+class UserQueryMixin:
+    """Statements shared by sync and async auth data managers."""
+
+    @staticmethod
+    def select_user(email: str) -> Select:
+        return select(UserModel).where(UserModel.email == email)
+
+    @staticmethod
+    def update_password(email: str, hashed_password: str) -> Update:
+        return (
+            update(UserModel)
+            .where(UserModel.email == email)
+            .values(hashed_password=hashed_password)
+        )
+
+    @staticmethod
+    def delete_refresh_token(token_hash: str) -> ReturningDelete[Tuple[str, int]]:
+        return (
+            delete(RefreshTokenModel)
+            .where(RefreshTokenModel.token_hash == token_hash)
+            .returning(RefreshTokenModel.email, RefreshTokenModel.expires_at)
+        )
 
-        model = self.get_one(select(UserModel).where(UserModel.email == email))
+    @staticmethod
+    def delete_expired_refresh_tokens(email: str, now: int) -> Delete:
+        return delete(RefreshTokenModel).where(
+            RefreshTokenModel.email == email, RefreshTokenModel.expires_at < now
+        )
+
+    @classmethod
+    def to_schema_or_none(cls, email: str, model: Any) -> UserSchema | None:
+        if model is None:
+            unknown_users.set(email, True)
+            return None
+
+        return cls.to_schema(model)
 
+    @staticmethod
+    def to_schema(model: Any) -> UserSchema:
         if not isinstance(model, UserModel):
             raise_with_log(status.HTTP_404_NOT_FOUND, "User not found")
 
@@ -179,3 +637,105 @@ class AuthDataManager(BaseDataManager):
             email=model.email,
             hashed_password=model.hashed_password,
         )
+
+
+class AuthDataManager(UserQueryMixin, BaseDataManager):
+    def add_user(self, user: UserModel) -> None:
+        """Write user to database."""
+
+        self.add_one(user)
+        unknown_users.delete(user.email)
+
+    def add_users(self, users: Sequence[Dict[str, Any]]) -> None:
+        """Write users to database, update the existing ones."""
+
+        self.upsert_all(UserModel, users)
+        for user in users:
+            unknown_users.delete(user["email"])
+
+    def get_user(self, email: str) -> UserSchema:
+        """Read user from database."""
+
+        return self.to_schema(self.get_one(self.select_user(email)))
+
+    def find_user(self, email: str) -> UserSchema | None:
+        """Read user from database, return :obj:`None` if user does not exist.
+
+        Unknown emails are cached in :data:`unknown_users`, so that
+        repeated lookups of them do not reach the database. The cache is
+        bounded by ``unknown_user_cache_size``, lookups of distinct unknown
+        emails are not saved, each of them queries the database.
+        """
+
+        if unknown_users.get(email):
+            return None
+
+        model = self.get_one(self.select_user(email))
+        return self.to_schema_or_none(email, model)
+
+    def set_password(self, email: str, hashed_password: str) -> None:
+        """Replace hashed password of the user."""
+
+        self.session.execute(self.update_password(email, hashed_password))
+
+
+class AsyncAuthDataManager(UserQueryMixin, AsyncBaseDataManager):
+    async def add_user(self, user: UserModel) -> None:
+        """Write user to database."""
+
+        await self.add_one(user)
+        unknown_users.delete(user.email)
+
+    async def get_user(self, email: str) -> UserSchema:
+        """Read user from database."""
+
+        return self.to_schema(await self.get_one(self.select_user(email)))
+
+    async def find_user(self, email: str) -> UserSchema | None:
+        """Read user from database, see :meth:`AuthDataManager.find_user`."""
+
+        if unknown_users.get(email):
+            return None
+
+        model = await self.get_one(self.select_user(email))
+        return self.to_schema_or_none(email, model)
+
+    async def set_password(self, email: str, hashed_password: str) -> None:
+        """Replace hashed password of the user."""
+
+        await self.session.execute(self.update_password(email, hashed_password))
+
+    async def add_refresh_token(self, token: RefreshTokenModel) -> None:
+        """Write refresh token to database."""
+
+        await self.add_one(token)
+        await self.session.flush()
+
+    async def pop_refresh_token(self, token_hash: str) -> str | None:
+        """Remove refresh token from database.
+
+        Deleting the row claims the token atomically, so that concurrent
+        exchanges of the same token can't both succeed.
+
+        Returns:
+            Email of the token owner, :obj:`None` if token
+            does not exist or has expired.
+        """
+
+        stmt = self.delete_refresh_token(token_hash)
+        row = (await self.session.execute(stmt)).first()
+
+        if row is None or row.expires_at < time.time():
+            return None
+
+        return str(row.email)
+
+    async def remove_refresh_token(self, token_hash: str) -> None:
+        """Remove refresh token from database."""
+
+        await self.session.execute(self.delete_refresh_token(token_hash))
+
+    async def remove_expired_refresh_tokens(self, email: str, now: int) -> None:
+        """Remove expired refresh tokens of the user."""
+
+        await self.session.execute(self.delete_expired_refresh_tokens(email, now))
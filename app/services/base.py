@@ -1,17 +1,36 @@
+import functools
+import json
 from typing import (
     Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
     List,
     Sequence,
+    Tuple,
     Type,
 )
 
 from sqlalchemy import (
+    bindparam,
     func,
+    literal,
     select,
+    Select,
+    text,
 )
+from sqlalchemy.dialects import (
+    postgresql,
+    sqlite,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.expression import Executable
+from sqlalchemy.types import TypeEngine
 
+from app.backend.cache import create_cache
+from app.backend.config import config
+from app.const import TVF_STREAM_BATCH
 from app.models.base import SQLModel
 
 
@@ -22,11 +41,88 @@ class SessionMixin:
         self.session = session
 
 
+class AsyncSessionMixin:
+    """Provides instance of async database session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+
 class BaseService(SessionMixin):
     """Base class for application services."""
 
 
-class BaseDataManager(SessionMixin):
+class AsyncBaseService(AsyncSessionMixin):
+    """Base class for async application services."""
+
+
+# results of table valued functions cached by get_cached_from_tvf
+tvf_cache = create_cache(config.cache, namespace="tvf")
+
+
+@functools.lru_cache(maxsize=1024)
+def tvf_statement(
+    model: Type[SQLModel], arg_types: Tuple[TypeEngine, ...], orm: bool = True
+) -> Executable:
+    """Return statement selecting from table valued function of the model.
+
+    Statement is built once per model and types of arguments, arguments
+    are bound as typed parameters on execution, so that drivers casting
+    parameters (e.g. asyncpg) resolve overloaded functions.
+
+    Args:
+        model:
+            Model describing function name and result columns.
+        arg_types:
+            SQL types of function arguments, see :func:`tvf_arg_types`.
+        orm:
+            Select model instances if True, plain rows otherwise.
+    """
+
+    fn = getattr(getattr(func, model.schema()), model.table_name())
+    params: List[Any] = [
+        bindparam(f"tvf_{i}", type_=arg_type) for i, arg_type in enumerate(arg_types)
+    ]
+    stmt = select(fn(*params).table_valued(*model.fields()))
+
+    if not orm:
+        return stmt
+
+    # rows of different calls may share primary keys, so that instances
+    # from identity map are refreshed with values of the current call
+    return select(model).from_statement(stmt).execution_options(populate_existing=True)
+
+
+def tvf_arg_types(args: Sequence[Any]) -> Tuple[TypeEngine, ...]:
+    """Return SQL types of function arguments inferred from their values."""
+
+    return tuple(literal(arg).type for arg in args)
+
+
+def tvf_params(args: Sequence[Any]) -> Dict[str, Any]:
+    """Return parameters binding arguments to :func:`tvf_statement`."""
+
+    return {f"tvf_{i}": arg for i, arg in enumerate(args)}
+
+
+class TVFMixin:
+    """Building statements selecting from table valued functions."""
+
+    @staticmethod
+    def select_from_tvf(
+        model: Type[SQLModel], args: Sequence[Any], orm: bool = True
+    ) -> Tuple[Executable, Dict[str, Any]]:
+        """Return statement and parameters selecting from table valued function."""
+
+        stmt = tvf_statement(model, tvf_arg_types(args), orm)
+        return stmt, tvf_params(args)
+
+    @staticmethod
+    def tvf_cache_key(model: Type[SQLModel], args: Sequence[Any]) -> str:
+        return tvf_cache.key(model.schema(), model.table_name(), json.dumps(args))
+
+
+class BaseDataManager(TVFMixin, SessionMixin):
     """Base data manager class responsible for operations over database."""
 
     def add_one(self, model: Any) -> None:
@@ -35,11 +131,106 @@ class BaseDataManager(SessionMixin):
     def add_all(self, models: Sequence[Any]) -> None:
         self.session.add_all(models)
 
+    def upsert_all(self, model: Type[SQLModel], rows: Sequence[Dict[str, Any]]) -> None:
+        """Insert rows, update the existing ones with the same primary key.
+
+        On Postgres and SQLite rows are written with a single executemany
+        ``INSERT ... ON CONFLICT DO UPDATE``, other databases fall back
+        to merging models one by one.
+        """
+
+        if not rows:
+            return
+
+        dialect = self.session.get_bind().dialect.name
+
+        if dialect not in ("postgresql", "sqlite"):
+            for row in rows:
+                self.session.merge(model(**row))
+            return
+
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(model)
+
+        keys = [column.name for column in model.__table__.primary_key]
+        values = {
+            name: stmt.excluded[name] for name in rows[0].keys() if name not in keys
+        }
+
+        self.session.execute(
+            stmt.on_conflict_do_update(index_elements=keys, set_=values), rows
+        )
+
     def get_one(self, select_stmt: Executable) -> Any:
         return self.session.scalar(select_stmt)
 
-    def get_all(self, select_stmt: Executable) -> List[Any]:
-        return list(self.session.scalars(select_stmt).all())
+    def get_all(
+        self, select_stmt: Executable, params: Dict[str, Any] | None = None
+    ) -> List[Any]:
+        return list(self.session.scalars(select_stmt, params).all())
+
+    def get_dicts(
+        self, select_stmt: Executable, params: Dict[str, Any] | None = None
+    ) -> List[Dict[str, Any]]:
+        """Return result rows as plain dictionaries.
+
+        Intended for read paths selecting columns rather than models,
+        skipping ORM instance creation and schema validation.
+        """
+
+        result = self.session.execute(select_stmt, params)
+        keys = [str(key) for key in result.keys()]
+        return [dict(zip(keys, row)) for row in result]
+
+    def stream_all(
+        self,
+        select_stmt: Executable,
+        yield_per: int,
+        params: Dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """Iterate over results fetching ``yield_per`` rows at once.
+
+        Uses server side cursor if supported by database driver, so that
+        the whole result is never loaded into memory.
+        """
+
+        yield from self.session.scalars(
+            select_stmt.execution_options(yield_per=yield_per), params
+        )
+
+    def stream_dicts(
+        self,
+        select_stmt: Executable,
+        yield_per: int,
+        params: Dict[str, Any] | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over result rows as dictionaries, see :meth:`stream_all`."""
+
+        result = self.session.execute(
+            select_stmt.execution_options(yield_per=yield_per), params
+        )
+        keys = [str(key) for key in result.keys()]
+        for row in result:
+            yield dict(zip(keys, row))
+
+    def explain(self, select_stmt: Select, analyze: bool = False) -> List[str]:
+        """Return query plan of the statement.
+
+        Statement parameters are rendered inline. ``analyze`` executes
+        the statement and reports actual timings (Postgres only).
+        """
+
+        dialect = self.session.get_bind().dialect
+        sql = select_stmt.compile(
+            dialect=dialect, compile_kwargs={"literal_binds": True}
+        )
+
+        if dialect.name == "postgresql":
+            prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+        else:
+            prefix = "EXPLAIN QUERY PLAN "
+
+        return [str(row[-1]) for row in self.session.execute(text(prefix + str(sql)))]
 
     def get_from_tvf(self, model: Type[SQLModel], *args: Any) -> List[Any]:
         """Query from table valued function.
@@ -62,10 +253,113 @@ class BaseDataManager(SessionMixin):
             BaseDataManager(session).get_from_tvf(MyModel, 1, "AAA")
         """
 
-        return self.get_all(self.select_from_tvf(model, *args))
+        return self.get_all(*self.select_from_tvf(model, args))
 
-    @staticmethod
-    def select_from_tvf(model: Type[SQLModel], *args: Any) -> Executable:
-        fn = getattr(getattr(func, model.schema()), model.table_name())
-        stmt = select(fn(*args).table_valued(*model.fields()))
-        return select(model).from_statement(stmt)
+    def stream_from_tvf(
+        self, model: Type[SQLModel], *args: Any, yield_per: int = TVF_STREAM_BATCH
+    ) -> Iterator[Any]:
+        """Iterate over results of table valued function.
+
+        Rows are fetched ``yield_per`` at once, see :meth:`stream_all`.
+        """
+
+        stmt, params = self.select_from_tvf(model, args)
+        yield from self.stream_all(stmt, yield_per, params)
+
+
+class AsyncBaseDataManager(TVFMixin, AsyncSessionMixin):
+    """Async counterpart of :class:`BaseDataManager`."""
+
+    async def add_one(self, model: Any) -> None:
+        self.session.add(model)
+
+    async def add_all(self, models: Sequence[Any]) -> None:
+        self.session.add_all(models)
+
+    async def get_one(self, select_stmt: Executable) -> Any:
+        return await self.session.scalar(select_stmt)
+
+    async def get_all(
+        self, select_stmt: Executable, params: Dict[str, Any] | None = None
+    ) -> List[Any]:
+        return list((await self.session.scalars(select_stmt, params)).all())
+
+    async def get_dicts(
+        self, select_stmt: Executable, params: Dict[str, Any] | None = None
+    ) -> List[Dict[str, Any]]:
+        """Return result rows as plain dictionaries.
+
+        See :meth:`BaseDataManager.get_dicts` for details.
+        """
+
+        result = await self.session.execute(select_stmt, params)
+        keys = [str(key) for key in result.keys()]
+        return [dict(zip(keys, row)) for row in result]
+
+    async def stream_all(
+        self,
+        select_stmt: Executable,
+        yield_per: int,
+        params: Dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate over results fetching ``yield_per`` rows at once.
+
+        See :meth:`BaseDataManager.stream_all` for details.
+        """
+
+        result = await self.session.stream_scalars(
+            select_stmt.execution_options(yield_per=yield_per), params
+        )
+        async for model in result:
+            yield model
+
+    async def stream_dicts(
+        self,
+        select_stmt: Executable,
+        yield_per: int,
+        params: Dict[str, Any] | None = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over result rows as dictionaries, see :meth:`stream_all`."""
+
+        result = await self.session.stream(
+            select_stmt.execution_options(yield_per=yield_per), params
+        )
+        keys = [str(key) for key in result.keys()]
+        async for row in result:
+            yield dict(zip(keys, row))
+
+    async def get_from_tvf(self, model: Type[SQLModel], *args: Any) -> List[Any]:
+        """Query from table valued function.
+
+        See :meth:`BaseDataManager.get_from_tvf` for details.
+        """
+
+        return await self.get_all(*self.select_from_tvf(model, args))
+
+    async def get_cached_from_tvf(
+        self, model: Type[SQLModel], *args: Any, ttl: float | None = None
+    ) -> List[Dict[str, Any]]:
+        """Query rows from table valued function through :data:`tvf_cache`.
+
+        Rows are returned as plain dictionaries and cached per model
+        and arguments for ``ttl`` seconds (cache default if not given).
+        Arguments must be JSON serializable.
+        """
+
+        async def load() -> List[Dict[str, Any]]:
+            return await self.get_dicts(*self.select_from_tvf(model, args, orm=False))
+
+        key = self.tvf_cache_key(model, args)
+        return await tvf_cache.get_or_load(key, load, ttl=ttl)
+
+    async def stream_from_tvf(
+        self, model: Type[SQLModel], *args: Any, yield_per: int = TVF_STREAM_BATCH
+    ) -> AsyncIterator[Any]:
+        """Iterate over results of table valued function.
+
+        See :meth:`BaseDataManager.stream_from_tvf` for details.
+        """
+
+        stmt, params = self.select_from_tvf(model, args)
+        async for model_ in self.stream_all(stmt, yield_per, params):
+            yield model_
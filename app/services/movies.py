@@ -1,43 +1,375 @@
-from typing import List
+import hashlib
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+)
 
-from sqlalchemy import select
+from fastapi import status
+from loguru import logger
+from sqlalchemy import (
+    select,
+    Select,
+    update,
+    Update,
+)
+from sqlalchemy.exc import DBAPIError
 
-from app.models.movies import MovieModel
-from app.schemas.movies import MovieSchema
+from app.backend.cache import create_cache
+from app.backend.config import config
+from app.backend.metrics import (
+    registry,
+    stats_callback,
+)
+from app.const import MOVIES_STREAM_BATCH
+from app.exc import raise_with_log
+from app.models.movies import (
+    CatalogueModel,
+    MovieModel,
+)
+from app.schemas.base import dump_json
+from app.schemas.movies import (
+    MovieBatchDict,
+    MovieDict,
+    MoviePageDict,
+    MovieSchema,
+)
 from app.services.base import (
+    AsyncBaseDataManager,
+    AsyncBaseService,
     BaseDataManager,
     BaseService,
 )
 
 
+# read-through cache of movie queries
+movie_cache = create_cache(config.cache, namespace="movies")
+
+# catalogue version seen by the process last, see get_catalogue_version
+seen_versions: Dict[str, int] = dict()
+
+# cached instead of the version if it is not tracked, versions start from 1
+UNTRACKED_VERSION = 0
+
+registry.gauge(
+    "myapi_movie_cache",
+    "Hits and misses of the movie cache.",
+    labels=("stat",),
+    callback=stats_callback(movie_cache.stats),
+)
+
+
+def movie_key(movie_id: int) -> str:
+    """Return cache key of the movie lookup by ID."""
+
+    return movie_cache.key("movie", int(movie_id))
+
+
+def movies_key(year: int, rating: float) -> str:
+    """Return cache key prefix of the movies lookups by ``year`` and ``rating``.
+
+    Rating is normalized, so that ``8`` and ``8.0`` share the same key.
+    """
+
+    return movie_cache.key("new", int(year), f"{float(rating):g}")
+
+
+def movies_page_key(year: int, rating: float, limit: int, after: int | None) -> str:
+    """Return cache key of the single page of movies lookup."""
+
+    return movies_key(year, rating) + f":page:{int(limit)}:{after}"
+
+
+def batch_ids(movie_ids: List[int]) -> List[int]:
+    """Return IDs of the batch lookup without duplicates.
+
+    Raises 422 if the number of distinct IDs exceeds ``movies_batch_size``.
+    """
+
+    movie_ids = list(dict.fromkeys(movie_ids))
+
+    if len(movie_ids) > config.movies_batch_size:
+        raise_with_log(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            f"Too many movies requested, maximum is {config.movies_batch_size}",
+        )
+
+    return movie_ids
+
+
+async def invalidate_movies(movie_id: int | None = None) -> None:
+    """Invalidate cached movies.
+
+    Must be called after movies are modified. Drops the movie with given ID
+    (or all movies if ID is not given), all the filtered lookups and
+    the cached catalogue version, so that ETags of the responses change.
+    """
+
+    if movie_id is None:
+        await movie_cache.invalidate_prefix("movie")
+    else:
+        await movie_cache.invalidate("movie", int(movie_id))
+    await movie_cache.invalidate_prefix("new")
+    await movie_cache.invalidate("version")
+
+
 class MovieService(BaseService):
     def get_movie(self, movie_id: int) -> MovieSchema:
         """Get movie by ID."""
 
-        return MovieDataManager(self.session).get_movie(movie_id)
+        movie = MovieDataManager(self.session).get_movie(movie_id)
+        return MovieSchema.model_construct(**movie)
 
     def get_movies(self, year: int, rating: float) -> List[MovieSchema]:
         """Select movies with filter by ``year`` and ``rating``."""
 
-        return MovieDataManager(self.session).get_movies(year, rating)
+        movies = MovieDataManager(self.session).get_movies(year, rating)
+        return [MovieSchema.model_construct(**movie) for movie in movies]
 
 
-class MovieDataManager(BaseDataManager):
-    def get_movie(self, movie_id: int) -> MovieSchema:
-        stmt = select(MovieModel).where(MovieModel.movie_id == movie_id)
-        model = self.get_one(stmt)
+class AsyncMovieService(AsyncBaseService):
+    """Async movie service reading through :data:`movie_cache`.
 
-        return MovieSchema(**model.to_dict())
+    Movies are returned as plain dictionaries read straight from
+    the database, routers serialize them without validation.
+    """
 
-    def get_movies(self, year: int, rating: float) -> List[MovieSchema]:
-        schemas: List[MovieSchema] = list()
+    async def get_catalogue_version(self) -> int | None:
+        """Return version of the movie catalogue, None if it is not tracked.
+
+        Version is stored in the catalogue table and incremented on every
+        write to movies (by database trigger, see migration ``0003``), so that
+        it never repeats. It is cached along with the movies until expired
+        or dropped by :func:`invalidate_movies`. Movies cached before the
+        version changed are dropped once the new version is read.
+
+        Missing version is cached as :data:`UNTRACKED_VERSION`, so that
+        it is not queried on every request.
+        """
+
+        async def load() -> int:
+            manager = AsyncMovieDataManager(self.session)
+            version = await manager.get_catalogue_version()
+            version = UNTRACKED_VERSION if version is None else version
+
+            seen = seen_versions.get("movies")
+            if seen is not None and seen != version:
+                await movie_cache.invalidate_prefix("movie")
+                await movie_cache.invalidate_prefix("new")
+
+            seen_versions["movies"] = version
+            return version
+
+        key = movie_cache.key("version")
+        version = await movie_cache.get_or_load(key, load)
+
+        return None if version == UNTRACKED_VERSION else version
+
+    async def get_etag(self, *parts: Any) -> str | None:
+        """Return ETag of the response identified by ``parts``.
+
+        ETag is computed from the catalogue version and request parts
+        (e.g. path and query), so that it is known before the response
+        is loaded and serialized. It is weak, since it is not derived
+        from the response body. None if catalogue version is not tracked.
+        """
+
+        version = await self.get_catalogue_version()
+        if version is None:
+            return None
+
+        digest = hashlib.blake2b(repr((version, parts)).encode(), digest_size=16)
+        return f'W/"{digest.hexdigest()}"'
+
+    async def get_movie(self, movie_id: int) -> MovieDict:
+        """Get movie by ID."""
+
+        async def load() -> MovieDict:
+            return await AsyncMovieDataManager(self.session).get_movie(movie_id)
+
+        return await movie_cache.get_or_load(movie_key(movie_id), load)
 
-        stmt = select(MovieModel).where(
+    async def get_movies(self, year: int, rating: float) -> List[MovieDict]:
+        """Select movies with filter by ``year`` and ``rating``.
+
+        Result is not cached, since its size is not bounded. Cache holds
+        only single movies and pages of at most ``MOVIES_PAGE_MAX_LIMIT`` rows.
+        """
+
+        return await AsyncMovieDataManager(self.session).get_movies(year, rating)
+
+    async def get_movies_page(
+        self, year: int, rating: float, limit: int, after: int | None = None
+    ) -> MoviePageDict:
+        """Select single page of movies with filter by ``year`` and ``rating``.
+
+        Movies are ordered by ID, ``after`` is the cursor returned
+        with the previous page.
+        """
+
+        async def load() -> MoviePageDict:
+            return await AsyncMovieDataManager(self.session).get_movies_page(
+                year, rating, limit, after
+            )
+
+        key = movies_page_key(year, rating, limit, after)
+        return await movie_cache.get_or_load(key, load)
+
+    async def get_movies_batch(self, movie_ids: List[int]) -> MovieBatchDict:
+        """Get movies by list of IDs.
+
+        Movies are returned in the order of the requested IDs, duplicates
+        are dropped. IDs of the movies not found are listed in ``missing``.
+        Cached movies are served from :data:`movie_cache`, the rest are
+        selected with a single query.
+        """
+
+        movie_ids = batch_ids(movie_ids)
+
+        async def load(keys: List[str]) -> Dict[str, MovieDict]:
+            ids = [key_to_id[key] for key in keys]
+            movies = await AsyncMovieDataManager(self.session).get_movies_by_ids(ids)
+            return {movie_key(movie["movie_id"]): movie for movie in movies}
+
+        key_to_id = {movie_key(movie_id): movie_id for movie_id in movie_ids}
+        found = await movie_cache.get_or_load_many(list(key_to_id), load)
+
+        movies = []
+        missing = []
+
+        for key, movie_id in key_to_id.items():
+            if key in found:
+                movies.append(found[key])
+            else:
+                missing.append(movie_id)
+
+        return {"movies": movies, "missing": missing}
+
+    async def stream_movies(self, year: int, rating: float) -> AsyncIterator[bytes]:
+        """Stream movies filtered by ``year`` and ``rating`` as NDJSON lines.
+
+        Rows are read from server side cursor in batches, bypassing
+        the cache, so that memory usage does not depend on result size.
+        """
+
+        manager = AsyncMovieDataManager(self.session)
+
+        async for movie in manager.stream_movies(year, rating):
+            yield dump_json(movie) + b"\n"
+
+
+class MovieQueryMixin:
+    """Statements shared by sync and async movie data managers.
+
+    Columns are selected instead of models, so that rows can be read
+    as plain dictionaries.
+    """
+
+    @staticmethod
+    def select_movie(movie_id: int) -> Select:
+        return select(*MovieModel.columns()).where(MovieModel.movie_id == movie_id)
+
+    @staticmethod
+    def select_movies(year: int, rating: float) -> Select:
+        return select(*MovieModel.columns()).where(
             MovieModel.released >= year,
             MovieModel.rating >= rating,
         )
 
-        for model in self.get_all(stmt):
-            schemas += [MovieSchema(**model.to_dict())]
+    @staticmethod
+    def select_movies_by_ids(movie_ids: List[int]) -> Select:
+        return select(*MovieModel.columns()).where(MovieModel.movie_id.in_(movie_ids))
+
+    @staticmethod
+    def select_catalogue_version() -> Select:
+        return select(CatalogueModel.version).where(CatalogueModel.name == "movies")
+
+    @staticmethod
+    def update_catalogue_version() -> Update:
+        return (
+            update(CatalogueModel)
+            .where(CatalogueModel.name == "movies")
+            .values(version=CatalogueModel.version + 1)
+        )
+
+    @classmethod
+    def select_movies_page(
+        cls, year: int, rating: float, limit: int, after: int | None
+    ) -> Select:
+        stmt = cls.select_movies(year, rating)
+
+        if after is not None:
+            stmt = stmt.where(MovieModel.movie_id > after)
+
+        return stmt.order_by(MovieModel.movie_id).limit(limit)
+
+    @staticmethod
+    def first(movies: List[MovieDict]) -> MovieDict:
+        if not movies:
+            raise_with_log(status.HTTP_404_NOT_FOUND, "Movie not found")
+
+        return movies[0]
+
+    @staticmethod
+    def to_page(movies: List[MovieDict], limit: int) -> MoviePageDict:
+        # one extra row is fetched to find out whether next page exists
+        next_cursor = movies[limit - 1]["movie_id"] if len(movies) > limit else None
+        return {"movies": movies[:limit], "next_cursor": next_cursor}
+
+
+class MovieDataManager(MovieQueryMixin, BaseDataManager):
+    def get_movie(self, movie_id: int) -> MovieDict:
+        return self.first(self.get_dicts(self.select_movie(movie_id)))
+
+    def get_movies(self, year: int, rating: float) -> List[MovieDict]:
+        return self.get_dicts(self.select_movies(year, rating))
+
+    def get_movies_by_ids(self, movie_ids: List[int]) -> List[MovieDict]:
+        return self.get_dicts(self.select_movies_by_ids(movie_ids))
+
+    def bump_catalogue_version(self) -> None:
+        """Increment catalogue version.
+
+        Done by database trigger on PostgreSQL, must be called
+        in the transaction modifying movies on other databases.
+        """
+
+        self.session.execute(self.update_catalogue_version())
+
+
+class AsyncMovieDataManager(MovieQueryMixin, AsyncBaseDataManager):
+    async def get_movie(self, movie_id: int) -> MovieDict:
+        return self.first(await self.get_dicts(self.select_movie(movie_id)))
+
+    async def get_movies(self, year: int, rating: float) -> List[MovieDict]:
+        return await self.get_dicts(self.select_movies(year, rating))
+
+    async def get_movies_by_ids(self, movie_ids: List[int]) -> List[MovieDict]:
+        return await self.get_dicts(self.select_movies_by_ids(movie_ids))
+
+    async def get_catalogue_version(self) -> int | None:
+        """Return version of the movies, None if catalogue table is missing.
+
+        Query runs in a savepoint, so that the failure (e.g. migration
+        ``0003`` is not applied) does not abort the session transaction.
+        """
+
+        try:
+            async with self.session.begin_nested():
+                return await self.get_one(self.select_catalogue_version())
+        except DBAPIError as e:
+            logger.warning(f"Catalogue version is not available: {e!r}")
+            return None
+
+    async def get_movies_page(
+        self, year: int, rating: float, limit: int, after: int | None
+    ) -> MoviePageDict:
+        stmt = self.select_movies_page(year, rating, limit + 1, after)
+        return self.to_page(await self.get_dicts(stmt), limit)
+
+    async def stream_movies(self, year: int, rating: float) -> AsyncIterator[MovieDict]:
+        stmt = self.select_movies(year, rating)
 
-        return schemas
+        async for movie in self.stream_dicts(stmt, MOVIES_STREAM_BATCH):
+            yield movie
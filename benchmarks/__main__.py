@@ -0,0 +1,59 @@
+"""Run load test and micro benchmarks, report results as JSON.
+
+Examples:
+    python -m benchmarks --users 100 --movies 100000 --output bench_output.txt
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import time
+
+from benchmarks import (
+    load,
+    micro,
+)
+from benchmarks.common import (
+    DEFAULT_DSN,
+    seed,
+    setup_environment,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", type=str, default=DEFAULT_DSN)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--movies", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--output", type=str, help="Write report to file")
+    args = parser.parse_args()
+
+    setup_environment(args.dsn)
+    seed(args.dsn, args.users, args.movies)
+
+    report = {
+        "params": vars(args),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "load": asyncio.run(
+            load.run(args.users, args.movies, args.concurrency, args.requests)
+        ),
+        "micro": micro.run(args.number),
+    }
+
+    output = json.dumps(report, indent=2)
+
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as f:
+            f.write(output)
+
+
+if __name__ == "__main__":
+    main()
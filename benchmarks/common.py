@@ -0,0 +1,131 @@
+"""Helpers shared by benchmarks."""
+
+import os
+from pathlib import Path
+import statistics
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from sqlalchemy import (
+    create_engine,
+    event,
+    insert,
+)
+from sqlalchemy.engine import (
+    Engine,
+    make_url,
+)
+
+
+PASSWORD = "password"
+
+DEFAULT_DSN = f"sqlite:///{Path(tempfile.gettempdir()) / 'myapi-bench.db'}"
+
+
+def setup_environment(dsn: str) -> None:
+    """Point application to the benchmark database.
+
+    Must be called before application modules are imported, since
+    configuration is read at import time. SQLite has no schemas, so
+    ``myapi`` schema is emulated with attached database file.
+    """
+
+    os.environ["MYAPI_DATABASE__DSN"] = dsn
+    os.environ.setdefault("MYAPI_TOKEN_KEY", "benchmark")
+    # load test logs in repeatedly from single client, login must not be throttled
+    os.environ.setdefault("MYAPI_RATE_LIMIT__IP_ATTEMPTS", "0")
+    os.environ.setdefault("MYAPI_RATE_LIMIT__USERNAME_ATTEMPTS", "0")
+
+    url = make_url(dsn)
+
+    if url.get_backend_name() == "sqlite":
+        if not url.database:
+            raise ValueError("SQLite benchmark database must be a file")
+
+        schema_path = str(Path(url.database).with_suffix(".myapi.db"))
+
+        @event.listens_for(Engine, "connect")
+        def attach(dbapi_connection: Any, _: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f"ATTACH DATABASE '{schema_path}' AS myapi")
+            cursor.close()
+
+
+def seed(dsn: str, users: int, movies: int) -> None:
+    """Recreate tables and fill them with generated users and movies.
+
+    All users share the same password :data:`PASSWORD`.
+    """
+
+    from app.models.auth import UserModel
+    from app.models.base import SQLModel
+    from app.models.movies import (
+        CatalogueModel,
+        MovieModel,
+    )
+    from app.services.auth import hash_password
+
+    engine = create_engine(dsn)
+
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+    # password hashing is slow, hash password only once
+    hashed_password = hash_password(PASSWORD)
+
+    with engine.begin() as connection:
+        connection.execute(insert(CatalogueModel), [{"name": "movies", "version": 1}])
+
+        if users > 0:
+            connection.execute(
+                insert(UserModel),
+                [
+                    {
+                        "email": user_email(i),
+                        "name": f"User {i}",
+                        "hashed_password": hashed_password,
+                    }
+                    for i in range(users)
+                ],
+            )
+        if movies > 0:
+            connection.execute(
+                insert(MovieModel),
+                [
+                    {
+                        "movie_id": i,
+                        "title": f"Movie {i}",
+                        "released": 1950 + i % 75,
+                        "rating": i % 100 / 10,
+                    }
+                    for i in range(movies)
+                ],
+            )
+
+    engine.dispose()
+
+
+def user_email(i: int) -> str:
+    return f"user{i}@myapi.com"
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, Any]:
+    """Return latency percentiles in milliseconds and throughput."""
+
+    if len(latencies) < 2:
+        raise ValueError("At least two measurements are required")
+
+    q = statistics.quantiles(latencies, n=100)
+
+    return {
+        "count": len(latencies),
+        "rps": round(len(latencies) / elapsed, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 4),
+        "p50_ms": round(q[49] * 1000, 4),
+        "p95_ms": round(q[94] * 1000, 4),
+        "p99_ms": round(q[98] * 1000, 4),
+    }
@@ -0,0 +1,142 @@
+"""Benchmark of the movie response encoding.
+
+Compares encode time of ``/movies/new`` response with FastAPI default path
+(content validated against response model and encoded with ``json``) and
+with :class:`app.responses.RawJSONResponse`, and response size
+and compression time of the supported content encodings.
+
+Examples:
+    python -m benchmarks.encoding --rows 1000 10000 100000
+"""
+
+import argparse
+import json
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.middleware import (
+    BrotliCompressor,
+    Compressor,
+    GzipCompressor,
+)
+from app.responses import RawJSONResponse
+from app.schemas.movies import MovieSchema
+
+
+response_adapter = TypeAdapter(List[MovieSchema])
+
+
+def create_movies(rows: int) -> List[Dict[str, Any]]:
+    """Return ``rows`` movies as read from database."""
+
+    return [
+        {
+            "movie_id": i,
+            "title": f"Movie {i}",
+            "released": 1950 + i % 75,
+            "rating": i % 100 / 10,
+        }
+        for i in range(rows)
+    ]
+
+
+def default_path(movies: List[Dict[str, Any]]) -> bytes:
+    """Validate against response model and encode as FastAPI does by default."""
+
+    content = response_adapter.dump_python(
+        response_adapter.validate_python(movies), mode="json"
+    )
+    return JSONResponse(content).body
+
+
+def raw_path(movies: List[Dict[str, Any]]) -> bytes:
+    """Encode as movie routers do."""
+
+    return RawJSONResponse(movies).body
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the best time of ``repeat`` runs in seconds."""
+
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings += [time.perf_counter() - start]
+
+    return min(timings)
+
+
+def compressors() -> Dict[str, Callable[[], Compressor]]:
+    """Return factories of the available compressors."""
+
+    factories: Dict[str, Callable[[], Compressor]] = {
+        "gzip-1": lambda: GzipCompressor(1),
+        "gzip-6": lambda: GzipCompressor(6),
+    }
+
+    try:
+        BrotliCompressor(4)
+    except ImportError:
+        return factories
+
+    factories["br-4"] = lambda: BrotliCompressor(4)
+    factories["br-11"] = lambda: BrotliCompressor(11)
+
+    return factories
+
+
+def compress(factory: Callable[[], Compressor], body: bytes) -> bytes:
+    compressor = factory()
+    return compressor.compress(body) + compressor.finish()
+
+
+def run(rows: List[int], repeat: int) -> List[Dict[str, Any]]:
+    results = []
+
+    for n in rows:
+        movies = create_movies(n)
+        body = raw_path(movies)
+        assert json.loads(default_path(movies)) == json.loads(body)
+
+        default = measure(lambda: default_path(movies), repeat)
+        raw = measure(lambda: raw_path(movies), repeat)
+
+        result: Dict[str, Any] = {
+            "rows": n,
+            "default_seconds": round(default, 4),
+            "raw_seconds": round(raw, 4),
+            "speedup": round(default / raw, 2),
+            "identity_bytes": len(body),
+        }
+
+        for name, factory in compressors().items():
+            seconds = measure(lambda: compress(factory, body), repeat)
+            result[f"{name}_bytes"] = len(compress(factory, body))
+            result[f"{name}_seconds"] = round(seconds, 4)
+
+        results += [result]
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.rows, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
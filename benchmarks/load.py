@@ -0,0 +1,145 @@
+"""Load test of the API endpoints.
+
+Drives ``/token``, ``/movies/`` and ``/movies/new`` through the ASGI app
+at given concurrency levels and reports latency percentiles and RPS.
+Set ``MYAPI_TOKEN_CACHE_SIZE=0`` and ``MYAPI_CACHE__MAXSIZE=0`` to measure
+the uncached paths.
+
+Examples:
+    python -m benchmarks.load --users 100 --movies 100000 --concurrency 1 10 50
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+)
+
+from benchmarks.common import (
+    DEFAULT_DSN,
+    PASSWORD,
+    seed,
+    setup_environment,
+    summarize,
+    user_email,
+)
+
+
+Request = Callable[[Any], Awaitable[Any]]
+
+
+async def drive(request: Request, client: Any, concurrency: int, total: int) -> Dict:
+    """Send ``total`` requests with ``concurrency`` workers."""
+
+    latencies: List[float] = list()
+    errors = 0
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await request(client)
+            latencies.append(time.perf_counter() - start)
+            errors += int(response.status_code >= 400)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "errors": errors,
+        **summarize(latencies, elapsed),
+    }
+
+
+async def run(
+    users: int, movies: int, concurrency: List[int], requests: int
+) -> Dict[str, List[Dict]]:
+    import httpx
+
+    from app.const import (
+        AUTH_URL,
+        MOVIES_URL,
+        MOVIES_URL_NEW,
+    )
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+
+    # ASGI transport does not run lifespan, enter it to warm up the pool
+    # and to close pooled connections while event loop is still running
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://bench") as client,
+    ):
+        # obtain tokens upfront, so that movie requests measure only movies
+        headers = list()
+        for i in range(min(users, 10)):
+            data = {"username": user_email(i), "password": PASSWORD}
+            token = (await client.post("/" + AUTH_URL, data=data)).json()
+            headers += [{"Authorization": "Bearer " + token["access_token"]}]
+
+        async def token(client: Any) -> Any:
+            data = {
+                "username": user_email(random.randrange(users)),
+                "password": PASSWORD,
+            }
+            return await client.post("/" + AUTH_URL, data=data)
+
+        async def movie(client: Any) -> Any:
+            params = {"movie_id": random.randrange(movies)}
+            url = "/" + MOVIES_URL + "/"
+            return await client.get(url, params=params, headers=random.choice(headers))
+
+        async def movies_new(client: Any) -> Any:
+            params = {"year": random.randrange(2015, 2025), "rating": 9.5}
+            url = "/" + MOVIES_URL + "/" + MOVIES_URL_NEW
+            return await client.get(url, params=params, headers=random.choice(headers))
+
+        scenarios: Dict[str, Request] = {
+            "token": token,
+            "movie": movie,
+            "movies_new": movies_new,
+        }
+
+        results: Dict[str, List[Dict]] = dict()
+
+        for name, request in scenarios.items():
+            results[name] = [
+                await drive(request, client, c, requests) for c in concurrency
+            ]
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", type=str, default=DEFAULT_DSN)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--movies", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--no-seed", action="store_true", help="Reuse database")
+    args = parser.parse_args()
+
+    setup_environment(args.dsn)
+    if not args.no_seed:
+        seed(args.dsn, args.users, args.movies)
+
+    results = asyncio.run(run(args.users, args.movies, args.concurrency, args.requests))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Micro benchmarks of the hot functions.
+
+Measures ``get_current_user`` (with and without token cache),
+``HashingMixin.verify``, ``SQLModel.to_dict`` and
+``MovieDataManager.get_movies`` and reports latency percentiles
+and calls per second.
+
+Examples:
+    python -m benchmarks.micro --movies 100000 --number 1000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from benchmarks.common import (
+    DEFAULT_DSN,
+    PASSWORD,
+    seed,
+    setup_environment,
+    summarize,
+)
+
+
+def measure(
+    fn: Callable[[], Any],
+    number: int,
+    setup: Callable[[], Any] | None = None,
+) -> Dict[str, Any]:
+    """Call function ``number`` times, ``setup`` is called before each call."""
+
+    latencies: List[float] = list()
+
+    for _ in range(number):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+
+    return summarize(latencies, sum(latencies))
+
+
+def run(number: int) -> Dict[str, Dict[str, Any]]:
+    from app.backend.session import open_session
+    from app.models.movies import MovieModel
+    from app.services.auth import (
+        get_current_user,
+        hash_password,
+        HashingMixin,
+        token_cache,
+        TokenMixin,
+    )
+    from app.services.movies import MovieDataManager
+
+    token = TokenMixin()._create_access_token("user", "user@myapi.com")
+    hashed_password = hash_password(PASSWORD)
+    movie = MovieModel(movie_id=1, title="Movie", released=2000, rating=8.5)
+
+    loop = asyncio.new_event_loop()
+
+    def current_user() -> Any:
+        return loop.run_until_complete(get_current_user(token))
+
+    results: Dict[str, Dict[str, Any]] = dict()
+
+    results["get_current_user"] = measure(current_user, number)
+    results["get_current_user_uncached"] = measure(
+        current_user, number, setup=token_cache.clear
+    )
+    results["verify"] = measure(
+        lambda: HashingMixin.verify(hashed_password, PASSWORD), max(number // 100, 2)
+    )
+    results["to_dict"] = measure(movie.to_dict, number)
+
+    with open_session() as session:
+        manager = MovieDataManager(session)
+        results["get_movies"] = measure(
+            lambda: manager.get_movies(2020, 9.5), max(number // 10, 2)
+        )
+
+    loop.close()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", type=str, default=DEFAULT_DSN)
+    parser.add_argument("--movies", type=int, default=10000)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--no-seed", action="store_true", help="Reuse database")
+    args = parser.parse_args()
+
+    setup_environment(args.dsn)
+    if not args.no_seed:
+        seed(args.dsn, 1, args.movies)
+
+    print(json.dumps(run(args.number), indent=2))
+
+
+if __name__ == "__main__":
+    main()
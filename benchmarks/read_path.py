@@ -0,0 +1,136 @@
+"""Benchmark of the movie read path.
+
+Compares ORM read path (models converted to schemas and validated
+against response model) with lean read path (columns selected as rows
+and serialized without validation). Runs against in-memory SQLite.
+
+Examples:
+    python -m benchmarks.read_path --rows 10000 100000 1000000
+"""
+
+import argparse
+import json
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    create_engine,
+    Engine,
+    event,
+    insert,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from app.models.movies import MovieModel
+from app.schemas.base import json_adapter
+from app.schemas.movies import MovieSchema
+from app.services.movies import MovieDataManager
+
+
+response_adapter = TypeAdapter(List[MovieSchema])
+
+
+def create_database(rows: int) -> Engine:
+    """Create in-memory database with ``rows`` movies."""
+
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS myapi")
+
+    MovieModel.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(MovieModel),
+            [
+                {
+                    "movie_id": i,
+                    "title": f"Movie {i}",
+                    "released": 1950 + i % 75,
+                    "rating": i % 100 / 10,
+                }
+                for i in range(rows)
+            ],
+        )
+
+    return engine
+
+
+def orm_path(session: Session) -> bytes:
+    """Read models, convert to schemas, validate and encode as FastAPI does."""
+
+    stmt = select(MovieModel).where(MovieModel.released >= 0, MovieModel.rating >= 0)
+    schemas = [MovieSchema(**model.to_dict()) for model in session.scalars(stmt)]
+    session.expunge_all()
+
+    content = response_adapter.dump_python(
+        response_adapter.validate_python(schemas), mode="json"
+    )
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def lean_path(session: Session) -> bytes:
+    """Read rows as dictionaries and serialize them without validation."""
+
+    return json_adapter.dump_json(MovieDataManager(session).get_movies(0, 0))
+
+
+def measure(fn: Callable[[Session], bytes], engine: Engine, repeat: int) -> float:
+    """Return the best time of ``repeat`` runs in seconds."""
+
+    timings = []
+
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            fn(session)
+            timings += [time.perf_counter() - start]
+
+    return min(timings)
+
+
+def run(rows: List[int], repeat: int) -> List[Dict[str, Any]]:
+    results = []
+
+    for n in rows:
+        engine = create_database(n)
+
+        with Session(engine) as session:
+            assert json.loads(orm_path(session)) == json.loads(lean_path(session))
+
+        orm = measure(orm_path, engine, repeat)
+        lean = measure(lean_path, engine, repeat)
+
+        results += [
+            {
+                "rows": n,
+                "orm_seconds": round(orm, 4),
+                "lean_seconds": round(lean, 4),
+                "speedup": round(orm / lean, 2),
+            }
+        ]
+        engine.dispose()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.rows, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,6 @@ from app.const import AUTH_URL
 from app.main import app
 
 
-client = TestClient(app)
-
-
 class TestConfig(BaseSettings):
     username: str = ""
     password: str = ""
@@ -26,13 +23,31 @@ class TestConfig(BaseSettings):
 _config = TestConfig()
 
 
+class Timer:
+    """Fake clock passed as ``timer`` to the time dependent components."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope="session")
+def client():
+    # keep single event loop, so that pooled async connections are reused
+    with TestClient(app) as _client:
+        yield _client
+
+
 @pytest.fixture
 def config():
     return _config
 
 
-@pytest.fixture
-def headers():
+@pytest.fixture(scope="session")
+def headers(client):
+    # single login per session, login attempts are rate limited
     data = {
         "username": _config.username,
         "password": _config.password,
@@ -42,3 +57,8 @@ def headers():
     schema = response.json()
 
     return {"Authorization": "Bearer " + schema["access_token"]}
+
+
+@pytest.fixture
+def timer():
+    return Timer()
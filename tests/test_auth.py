@@ -1,17 +1,43 @@
+import asyncio
+from datetime import (
+    datetime,
+    timedelta,
+)
+import time
+
 from fastapi import status
-from fastapi.testclient import TestClient
+from fastapi.exceptions import HTTPException
+from passlib.context import CryptContext
+import pytest
 
+from app.backend.config import config as app_config
 from app.const import (
     AUTH_URL,
+    AUTH_URL_REFRESH,
+    AUTH_URL_REVOKE,
     TOKEN_TYPE,
 )
-from app.main import app
+from app.schemas.auth import UserSchema
+from app.services import auth
+from app.services.auth import (
+    decode_user,
+    key_ring,
+    TokenMixin,
+)
+
 
+def claims(email="user@myapi.com", **kwargs):
+    return {"name": "user", "sub": email, **kwargs}
 
-client = TestClient(app)
 
+def decode_error(payload):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_user(key_ring.encode(payload))
 
-def test_login(config):
+    return exc_info.value.detail
+
+
+def test_login(client, config):
     data = {
         "username": config.username,
         "password": config.password,
@@ -25,7 +51,7 @@ def test_login(config):
     assert isinstance(schema["access_token"], str)
 
 
-def test_incorrect_password(config):
+def test_incorrect_password(client, config):
     data = {
         "username": config.username,
         "password": "fake_password",
@@ -33,3 +59,134 @@ def test_incorrect_password(config):
 
     response = client.post("/" + AUTH_URL, data=data)
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_unknown_user(client, config, monkeypatch):
+    data = {
+        "username": "unknown@myapi.com",
+        "password": config.password,
+    }
+
+    response = client.post("/" + AUTH_URL, data=data)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert auth.unknown_users.get("unknown@myapi.com")
+
+    # cached unknown user is verified as well
+    verified = []
+    verify_async = TokenMixin.verify_async
+
+    async def verify(hashed_password, plain_password):
+        verified.append(hashed_password)
+        return await verify_async(hashed_password, plain_password)
+
+    monkeypatch.setattr(TokenMixin, "verify_async", staticmethod(verify))
+
+    assert client.post("/" + AUTH_URL, data=data).json() == response.json()
+    assert verified == [auth.dummy_hash()]
+
+    # same response as for the wrong password
+    data["username"] = config.username
+    data["password"] = "fake_password"
+    assert client.post("/" + AUTH_URL, data=data).json() == response.json()
+
+
+def test_dummy_hash_in_pool(monkeypatch):
+    calls = []
+
+    class Pool:
+        async def run(self, fn, *args):
+            calls.append(fn)
+            return fn(*args)
+
+    monkeypatch.setattr(auth, "_dummy_hash", "")
+    monkeypatch.setattr(auth, "hashing_pool", Pool())
+
+    hashed = asyncio.run(auth.dummy_hash_async())
+
+    assert calls == [auth.hash_password]
+    assert asyncio.run(auth.dummy_hash_async()) == auth.dummy_hash() == hashed
+    assert len(calls) == 1
+
+
+def test_refresh_token(client, config):
+    data = {
+        "username": config.username,
+        "password": config.password,
+    }
+
+    refresh_token = client.post("/" + AUTH_URL, data=data).json()["refresh_token"]
+
+    url = "/" + AUTH_URL + "/" + AUTH_URL_REFRESH
+    response = client.post(url, data={"refresh_token": refresh_token})
+    schema = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert schema["refresh_token"] != refresh_token
+
+    # refresh token is rotated on use
+    response = client.post(url, data={"refresh_token": refresh_token})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = client.post(
+        "/" + AUTH_URL + "/" + AUTH_URL_REVOKE,
+        data={"refresh_token": schema["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = client.post(url, data={"refresh_token": schema["refresh_token"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_token_claims():
+    token = TokenMixin()._create_access_token("user", "user@myapi.com")
+    payload = key_ring.decode(token)
+
+    assert payload["exp"] - payload["iat"] == app_config.token_expire_minutes * 60
+    assert payload["nbf"] == payload["iat"]
+    assert decode_user(token).email == "user@myapi.com"
+
+
+def test_expired_token():
+    now = int(time.time())
+    leeway = app_config.token_leeway
+
+    # expired within leeway
+    payload = claims("leeway@myapi.com", exp=now - leeway / 2)
+    assert decode_user(key_ring.encode(payload)).email == "leeway@myapi.com"
+
+    assert decode_error(claims(exp=now - leeway - 1)) == "Token expired"
+    assert decode_error(claims(exp=now + 60, nbf=now + 3600)) == "Invalid credentials"
+
+
+def test_legacy_token():
+    expires_at = datetime.utcnow() + timedelta(minutes=1)
+    payload = claims("legacy@myapi.com", expires_at=f"{expires_at:%Y-%m-%d %H:%M:%S}")
+    assert decode_user(key_ring.encode(payload)).email == "legacy@myapi.com"
+
+    expires_at = datetime.utcnow() - timedelta(minutes=1)
+    payload = claims(expires_at=f"{expires_at:%Y-%m-%d %H:%M:%S}")
+    assert decode_error(payload) == "Token expired"
+
+    assert decode_error(claims()) == "Invalid credentials"
+
+
+def test_rehash_password(monkeypatch):
+    hashed_password = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("pw")
+    user = UserSchema(
+        name="user", email="user@myapi.com", hashed_password=hashed_password
+    )
+
+    # hash is up to date
+    context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+    monkeypatch.setattr(auth, "pwd_context", context)
+    assert TokenMixin()._verify_login(user, "pw") == (user, None)
+
+    # bcrypt is deprecated in favor of another scheme
+    context = CryptContext(schemes=["pbkdf2_sha256", "bcrypt"], deprecated="auto")
+    monkeypatch.setattr(auth, "pwd_context", context)
+    _, new_hash = TokenMixin()._verify_login(user, "pw")
+    assert new_hash.startswith("$pbkdf2-sha256$")
+    assert context.verify("pw", new_hash)
+
+    with pytest.raises(HTTPException):
+        TokenMixin()._verify_login(user, "wrong")
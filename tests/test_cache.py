@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from app.backend.cache import (
+    CacheBackend,
+    LRUCache,
+    MemoryBackend,
+    ReadThroughCache,
+)
+
+
+def test_lru_eviction():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl(timer):
+    cache = LRUCache(10, ttl=10, timer=timer)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1)
+
+    timer.now = 5
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    timer.now = 10
+    assert cache.get("a") is None
+
+
+def test_stats():
+    cache = LRUCache(10)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats() == {"size": 1, "maxsize": 10, "hits": 1, "misses": 1}
+
+
+def test_disabled():
+    cache = LRUCache(0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_single_flight():
+    cache = ReadThroughCache(MemoryBackend(10), "test")
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"x": 1}
+
+    async def run():
+        key = cache.key("a", 1)
+        return await asyncio.gather(*[cache.get_or_load(key, load) for _ in range(5)])
+
+    assert asyncio.run(run()) == [{"x": 1}] * 5
+    assert len(calls) == 1
+
+
+def test_get_or_load_many():
+    cache = ReadThroughCache(MemoryBackend(10), "test")
+    calls = []
+
+    async def load(keys):
+        calls.append(keys)
+        return {key: key.upper() for key in keys if key != "c"}
+
+    async def run():
+        await cache.backend.set("a", "cached")
+        return await cache.get_or_load_many(["a", "b", "c"], load)
+
+    assert asyncio.run(run()) == {"a": "cached", "b": "B"}
+    assert calls == [["b", "c"]]
+    assert cache.stats()["misses"] == 2
+
+
+def test_invalidate_prefix():
+    cache = ReadThroughCache(MemoryBackend(10), "test")
+
+    async def run():
+        await cache.backend.set(cache.key("a", 1), 1)
+        await cache.backend.set(cache.key("a", 2), 2)
+        await cache.backend.set(cache.key("b", 1), 3)
+        await cache.invalidate_prefix("a")
+        keys = [("a", 1), ("a", 2), ("b", 1)]
+        return [await cache.backend.get(cache.key(*key)) for key in keys]
+
+    assert asyncio.run(run()) == [None, None, 3]
+
+
+def test_backend_abstract():
+    class PartialBackend(CacheBackend):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialBackend()
@@ -0,0 +1,119 @@
+from contextlib import contextmanager
+import os
+import re
+import subprocess
+import sys
+
+from click.testing import CliRunner
+from sqlalchemy import (
+    create_engine,
+    event,
+    insert,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from app.backend import session as session_module
+from app.cli import main
+from app.models.auth import UserModel
+from app.services.auth import verify_password
+from app.version import __version__
+
+
+# cumulative import time of app.cli in microseconds
+IMPORT_TIME_BUDGET = 250_000
+
+HEAVY_MODULES = ("alembic", "fastapi", "jose", "passlib", "sqlalchemy")
+
+
+def run_version(*options):
+    # strip settings, --version must not need them
+    env = {k: v for k, v in os.environ.items() if not k.startswith("MYAPI_")}
+    code = (
+        "import sys; from app.cli import main; main(['--version'], standalone_mode=False);"
+        "print(' '.join(sys.modules))"
+    )
+
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def test_version():
+    result = CliRunner().invoke(main, ["--version"])
+
+    assert result.exit_code == 0
+    assert __version__ in result.output
+
+
+def test_version_lazy_imports():
+    result = run_version()
+    modules = result.stdout.splitlines()[-1].split()
+
+    assert __version__ in result.stdout
+    assert not {module.split(".")[0] for module in modules} & set(HEAVY_MODULES)
+    assert "app.backend.session" not in modules
+
+
+def test_version_import_time():
+    result = run_version("-X", "importtime")
+    match = re.search(r"\|\s*(\d+)\s*\| app\.cli$", result.stderr, re.MULTILINE)
+
+    assert match is not None
+    assert int(match.group(1)) < IMPORT_TIME_BUDGET
+
+
+def test_import_users(tmp_path, monkeypatch):
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS myapi")
+
+    UserModel.metadata.create_all(engine, tables=[UserModel.__table__])
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(UserModel),
+            [{"email": "a@x", "name": "old", "hashed_password": "old"}],
+        )
+
+    @contextmanager
+    def open_session():
+        with Session(engine) as session, session.begin():
+            yield session
+
+    monkeypatch.setattr(session_module, "open_session", open_session)
+
+    # b@x is repeated within the first chunk and in the second one
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "name,email,password\n"
+        "A,a@x,pa\n"
+        "B1,b@x,pb1\n"
+        "B2,b@x,pb2\n"
+        "C,c@x,pc\n"
+        "B3,b@x,pb3\n"
+    )
+
+    result = CliRunner().invoke(
+        main, ["import-users", str(path), "--chunk-size", "3", "--workers", "1"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[-1].startswith("3 users imported")
+
+    with Session(engine) as session:
+        users = {user.email: user for user in session.scalars(select(UserModel))}
+
+    assert {email: user.name for email, user in users.items()} == {
+        "a@x": "A",
+        "b@x": "B3",
+        "c@x": "C",
+    }
+    assert verify_password(users["a@x"].hashed_password, "pa")
+    assert verify_password(users["b@x"].hashed_password, "pb3")
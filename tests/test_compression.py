@@ -0,0 +1,105 @@
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+import pytest
+
+from app.middleware import CompressionMiddleware
+from app.responses import RawJSONResponse
+from app.schemas.base import (
+    dump_json,
+    json_adapter,
+)
+
+
+movies = [
+    {"movie_id": i, "title": f"Movie {i}", "released": 2000, "rating": 8.5}
+    for i in range(100)
+]
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+
+@app.get("/large")
+async def large() -> RawJSONResponse:
+    return RawJSONResponse(movies)
+
+
+@app.get("/tagged")
+async def tagged() -> RawJSONResponse:
+    return RawJSONResponse(movies, headers={"ETag": '"abc"'})
+
+
+@app.get("/small")
+async def small() -> RawJSONResponse:
+    return RawJSONResponse(movies[:1])
+
+
+@app.get("/stream")
+async def stream() -> StreamingResponse:
+    async def lines():
+        for movie in movies:
+            yield dump_json(movie) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as _client:
+        yield _client
+
+
+def test_dump_json():
+    assert json.loads(dump_json(movies)) == json.loads(json_adapter.dump_json(movies))
+
+
+def test_compressed(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(dump_json(movies))
+    assert response.json() == movies
+
+
+def test_not_compressed(client):
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == movies[:1]
+
+    for accept_encoding in ["identity", "gzip;q=0", "deflate"]:
+        response = client.get("/large", headers={"Accept-Encoding": accept_encoding})
+        assert "content-encoding" not in response.headers
+        assert response.json() == movies
+
+
+def test_streaming(client):
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as r:
+        assert r.headers["content-encoding"] == "gzip"
+        assert "content-length" not in r.headers
+        body = b"".join(r.iter_raw())
+
+    lines = gzip.decompress(body).splitlines()
+    assert [json.loads(line) for line in lines] == movies
+
+
+def test_etag_weakened(client):
+    response = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["etag"] == 'W/"abc"'
+
+    response = client.get("/tagged", headers={"Accept-Encoding": "identity"})
+    assert response.headers["etag"] == '"abc"'
+
+
+def test_negotiate():
+    middleware = CompressionMiddleware(app, encodings=["gzip"])
+
+    assert middleware.negotiate("gzip, deflate, br") == "gzip"
+    assert middleware.negotiate("br;q=1.0, GZIP;q=0.5") == "gzip"
+    assert middleware.negotiate("*") == "gzip"
+    assert middleware.negotiate("gzip;q=0") is None
+    assert middleware.negotiate("") is None
@@ -0,0 +1,35 @@
+from fastapi.exceptions import HTTPException
+import pytest
+
+from app.exc import (
+    ErrorSampler,
+    raise_with_log,
+)
+
+
+def test_error_sampler(timer):
+    sampler = ErrorSampler(10, timer=timer)
+
+    assert sampler.sample("a") == 0
+    assert sampler.sample("a") is None
+    assert sampler.sample("a") is None
+    assert sampler.sample("b") == 0
+
+    timer.now = 10
+    assert sampler.sample("a") == 2
+    assert sampler.sample("b") == 0
+
+
+def test_error_sampler_disabled():
+    sampler = ErrorSampler(0)
+
+    assert sampler.sample("a") == 0
+    assert sampler.sample("a") == 0
+
+
+def test_raise_with_log():
+    with pytest.raises(HTTPException) as exc_info:
+        raise_with_log(404, "Not found")
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "Not found"
@@ -0,0 +1,64 @@
+import asyncio
+
+from fastapi import status
+
+from app.backend.health import CachedProbe
+from app.const import (
+    HEALTH_URL,
+    HEALTH_URL_LIVE,
+    HEALTH_URL_READY,
+)
+from app.routers import health
+
+
+def test_live(client):
+    response = client.get("/" + HEALTH_URL + "/" + HEALTH_URL_LIVE)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "ok"}
+
+
+def test_ready(client):
+    response = client.get("/" + HEALTH_URL + "/" + HEALTH_URL_READY)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "ok"}
+
+
+def test_ready_retries_warm_up(client, monkeypatch):
+    results = [False, True]
+
+    async def warm_up():
+        return results.pop(0)
+
+    monkeypatch.setattr(health, "warm_up_probe", CachedProbe(warm_up, interval=0))
+    monkeypatch.setattr(client.app.state, "ready", False)
+
+    response = client.get("/" + HEALTH_URL + "/" + HEALTH_URL_READY)
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    response = client.get("/" + HEALTH_URL + "/" + HEALTH_URL_READY)
+    assert response.status_code == status.HTTP_200_OK
+    assert client.app.state.ready is True
+
+
+def test_cached_probe(timer):
+    results = [True, False]
+    calls = []
+
+    async def check():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return results[len(calls) - 1]
+
+    probe = CachedProbe(check, interval=5, timer=timer)
+
+    async def run():
+        return await asyncio.gather(*[probe() for _ in range(5)])
+
+    assert asyncio.run(run()) == [True] * 5
+    assert len(calls) == 1
+
+    timer.now = 5
+    assert asyncio.run(probe()) is False
+    assert len(calls) == 2
@@ -0,0 +1,117 @@
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import (
+    ec,
+    rsa,
+)
+from fastapi import status
+from jose import (
+    jwt,
+    JWTError,
+)
+import pytest
+
+from app.backend.config import TokenKeyConfig
+from app.backend.keys import KeyRing
+from app.const import JWKS_URL
+
+
+def pem(private_key, public=False):
+    if public:
+        return (
+            private_key.public_key()
+            .public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+            .decode()
+        )
+
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.fixture(scope="module")
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ec_key():
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+def test_sign_and_verify(rsa_key, ec_key):
+    keys = [
+        TokenKeyConfig(kid="rsa", algorithm="RS256", private_key=pem(rsa_key)),
+        TokenKeyConfig(kid="ec", algorithm="ES256", private_key=pem(ec_key)),
+    ]
+
+    for kid in ("rsa", "ec"):
+        ring = KeyRing(keys, kid=kid)
+        token = ring.encode({"sub": "user"})
+
+        assert jwt.get_unverified_header(token)["kid"] == kid
+        assert ring.decode(token) == {"sub": "user"}
+
+
+def test_rotation(rsa_key, ec_key):
+    old = KeyRing([TokenKeyConfig(kid="old", private_key=pem(rsa_key))])
+    token = old.encode({"sub": "user"})
+
+    # old key is kept to verify tokens issued before rotation
+    new = KeyRing(
+        [
+            TokenKeyConfig(kid="new", algorithm="ES256", private_key=pem(ec_key)),
+            TokenKeyConfig(kid="old", public_key=pem(rsa_key, public=True)),
+        ]
+    )
+
+    assert new.kid == "new"
+    assert new.decode(token) == {"sub": "user"}
+
+    # old key is retired
+    retired = KeyRing(
+        [TokenKeyConfig(kid="new", algorithm="ES256", private_key=pem(ec_key))]
+    )
+    with pytest.raises(JWTError):
+        retired.decode(token)
+
+
+def test_shared_secret():
+    ring = KeyRing([], secret="secret")
+    token = ring.encode({"sub": "user"})
+
+    assert "kid" not in jwt.get_unverified_header(token)
+    assert ring.decode(token) == {"sub": "user"}
+    assert ring.jwks() == {"keys": []}
+
+    with pytest.raises(JWTError):
+        KeyRing([]).decode(token)
+
+
+def test_jwks(rsa_key):
+    ring = KeyRing([TokenKeyConfig(kid="rsa", private_key=pem(rsa_key))])
+    (key,) = ring.jwks()["keys"]
+
+    assert key["kid"] == "rsa"
+    assert key["kty"] == "RSA"
+    assert key["alg"] == "RS256"
+    assert "d" not in key
+
+
+def test_invalid_keys(rsa_key):
+    with pytest.raises(ValueError):
+        KeyRing([TokenKeyConfig(kid="empty")])
+
+    with pytest.raises(ValueError):
+        KeyRing([TokenKeyConfig(kid="rsa", private_key=pem(rsa_key))], kid="other")
+
+
+def test_jwks_endpoint(client):
+    response = client.get("/" + JWKS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "keys" in response.json()
@@ -0,0 +1,7 @@
+from app.backend.session import _engines
+
+
+def test_lifespan(client):
+    # pool is warmed up by the startup of the client
+    assert client.app.state.ready is True
+    assert "async" in _engines
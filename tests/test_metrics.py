@@ -0,0 +1,48 @@
+from fastapi import status
+
+from app.backend.metrics import Registry
+from app.const import METRICS_URL
+
+
+def test_counter():
+    registry = Registry()
+    counter = registry.counter("requests_total", "Requests.", labels=("path",))
+    counter.inc("/a")
+    counter.inc("/a", amount=2)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{path="/a"} 3',
+    ]
+
+
+def test_histogram():
+    registry = Registry()
+    histogram = registry.histogram("latency", "Latency.", buckets=(0.1, 1))
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_bucket{le="0.1"} 1',
+        'latency_bucket{le="1"} 2',
+        'latency_bucket{le="+Inf"} 3',
+        "latency_sum 5.6",
+        "latency_count 3",
+    ]
+
+
+def test_disabled():
+    registry = Registry(enabled=False)
+    counter = registry.counter("requests_total", "Requests.")
+    counter.inc()
+
+    assert registry.render().splitlines()[2:] == []
+
+
+def test_metrics(client):
+    response = client.get("/" + METRICS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "myapi_http_request_duration_seconds" in response.text
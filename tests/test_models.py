@@ -5,6 +5,7 @@ from sqlalchemy.orm import (
 )
 
 from app.models.base import SQLModel
+from app.models.movies import MovieModel
 
 
 class Model(SQLModel):
@@ -37,3 +38,15 @@ def test_dict():
     schema = Schema(**model.to_dict())
     assert schema.x == 1
     assert schema.y == "AAA"
+
+
+def test_columns():
+    assert [column.key for column in Model.columns()] == ["x", "y"]
+
+
+def test_movie_indexes():
+    indexes = {index.name: index for index in MovieModel.__table__.indexes}
+    index = indexes["ix_movies_released_rating"]
+
+    assert [column.name for column in index.columns] == ["released", "rating"]
+    assert index.dialect_options["postgresql"]["include"] == ["movie_id", "title"]
@@ -1,17 +1,34 @@
+import asyncio
+import json
+
 from fastapi import status
-from fastapi.testclient import TestClient
+from sqlalchemy import (
+    event,
+    text,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    create_async_engine,
+)
 
+from app.backend.config import config
+from app.backend.session import open_session
 from app.const import (
     MOVIES_URL,
+    MOVIES_URL_BATCH,
     MOVIES_URL_NEW,
+    MOVIES_URL_PAGE,
+    MOVIES_URL_STREAM,
+)
+from app.services.movies import (
+    AsyncMovieDataManager,
+    invalidate_movies,
+    movie_cache,
+    MovieDataManager,
 )
-from app.main import app
-
-
-client = TestClient(app)
 
 
-def test_get_movie(headers):
+def test_get_movie(client, headers):
     params = {
         "movie_id": 1,
     }
@@ -23,7 +40,43 @@ def test_get_movie(headers):
     assert schema["movie_id"] == 1
 
 
-def test_get_movies(headers):
+def test_get_movies_batch(client, headers):
+    params = {
+        "movie_id": [3, 1, 10**9, 3],
+    }
+
+    url = "/" + MOVIES_URL + "/" + MOVIES_URL_BATCH
+    response = client.get(url, headers=headers, params=params)
+    schema = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [movie["movie_id"] for movie in schema["movies"]] == [3, 1]
+    assert schema["missing"] == [10**9]
+
+
+def test_get_movies_batch_too_many(client, headers):
+    params = {
+        "movie_id": list(range(1, config.movies_batch_size + 2)),
+    }
+
+    url = "/" + MOVIES_URL + "/" + MOVIES_URL_BATCH
+    response = client.get(url, headers=headers, params=params)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    # limit applies to conditional requests as well
+    params["movie_id"] = params["movie_id"][:-1]
+    etag = client.get(url, headers=headers, params=params).headers["etag"]
+    params["movie_id"].append(config.movies_batch_size + 1)
+
+    response = client.get(
+        url, headers={**headers, "If-None-Match": etag}, params=params
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_get_movies(client, headers):
     params = {
         "year": 2000,
         "rating": 8,
@@ -35,3 +88,168 @@ def test_get_movies(headers):
 
     assert response.status_code == status.HTTP_200_OK
     assert len(schema) > 0
+
+
+def test_get_movies_page(client, headers):
+    params = {
+        "year": 2000,
+        "rating": 8,
+        "limit": 2,
+    }
+
+    url = "/" + MOVIES_URL + "/" + MOVIES_URL_NEW
+    movies = client.get(url, headers=headers, params=params).json()
+
+    ids = []
+    while True:
+        response = client.get(
+            url + "/" + MOVIES_URL_PAGE, headers=headers, params=params
+        )
+        schema = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(schema["movies"]) <= 2
+
+        ids += [movie["movie_id"] for movie in schema["movies"]]
+        if schema["next_cursor"] is None:
+            break
+        params["after"] = schema["next_cursor"]
+
+    assert ids == sorted(movie["movie_id"] for movie in movies)
+
+
+def test_stream_movies(client, headers):
+    params = {
+        "year": 2000,
+        "rating": 8,
+    }
+
+    url = "/" + MOVIES_URL + "/" + MOVIES_URL_NEW
+    movies = client.get(url, headers=headers, params=params).json()
+
+    response = client.get(url + "/" + MOVIES_URL_STREAM, headers=headers, params=params)
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert sorted(lines, key=lambda x: x["movie_id"]) == sorted(
+        movies, key=lambda x: x["movie_id"]
+    )
+
+
+def test_get_movies_not_modified(client, headers):
+    # large enough to be compressed
+    params = {
+        "year": 0,
+        "rating": 0,
+    }
+
+    url = "/" + MOVIES_URL + "/" + MOVIES_URL_NEW
+    response = client.get(url, headers=headers, params=params)
+    etag = response.headers["etag"]
+
+    assert response.headers["content-encoding"] == "gzip"
+
+    assert response.headers["cache-control"] == "private, max-age=60"
+
+    response = client.get(
+        url, headers={**headers, "If-None-Match": etag}, params=params
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    # other query has other tag
+    response = client.get(
+        url, headers={**headers, "If-None-Match": etag}, params={**params, "rating": 9}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+def test_get_movie_etag_changes(client, headers):
+    params = {
+        "movie_id": 1,
+    }
+
+    response = client.get("/" + MOVIES_URL, headers=headers, params=params)
+    etag = response.headers["etag"]
+
+    with open_session() as session:
+        MovieDataManager(session).bump_catalogue_version()
+    asyncio.run(invalidate_movies(1))
+
+    response = client.get(
+        "/" + MOVIES_URL, headers={**headers, "If-None-Match": etag}, params=params
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["movie_id"] == 1
+
+    # version reloaded after cached one expires never returns to the old one
+    new_etag = response.headers["etag"]
+    asyncio.run(movie_cache.invalidate("version"))
+    response = client.get("/" + MOVIES_URL, headers=headers, params=params)
+
+    assert response.headers["etag"] == new_etag != etag
+
+
+def test_get_movie_any_not_modified(client, headers):
+    params = {
+        "movie_id": 10**9,
+    }
+
+    response = client.get(
+        "/" + MOVIES_URL, headers={**headers, "If-None-Match": "*"}, params=params
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_untracked_version_cached(client, headers, monkeypatch):
+    calls = []
+
+    async def get_catalogue_version(self):
+        calls.append(1)
+        return None
+
+    monkeypatch.setattr(
+        AsyncMovieDataManager, "get_catalogue_version", get_catalogue_version
+    )
+    asyncio.run(movie_cache.invalidate("version"))
+
+    try:
+        for _ in range(3):
+            response = client.get(
+                "/" + MOVIES_URL, headers=headers, params={"movie_id": 1}
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert "etag" not in response.headers
+
+        assert len(calls) == 1
+    finally:
+        asyncio.run(movie_cache.invalidate("version"))
+
+
+def test_catalogue_table_missing():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def attach(dbapi_connection, _):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("ATTACH DATABASE ':memory:' AS myapi")
+            cursor.close()
+
+        async with AsyncSession(engine) as session:
+            manager = AsyncMovieDataManager(session)
+            assert await manager.get_catalogue_version() is None
+
+            # transaction is still usable
+            assert (await session.execute(text("SELECT 1"))).scalar() == 1
+
+        await engine.dispose()
+
+    asyncio.run(run())
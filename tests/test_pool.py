@@ -0,0 +1,28 @@
+import asyncio
+import operator
+
+import pytest
+
+from app.backend.pool import WorkerPool
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_run(kind):
+    pool = WorkerPool(kind, 2)
+
+    async def run():
+        return await asyncio.gather(*[pool.run(operator.add, i, 1) for i in range(4)])
+
+    assert asyncio.run(run()) == [1, 2, 3, 4]
+    assert pool.stats() == {
+        "workers": 2,
+        "in_flight": 0,
+        "queue_depth": 0,
+        "completed": 4,
+    }
+    pool.shutdown()
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        WorkerPool("fiber", 1)
@@ -0,0 +1,63 @@
+import asyncio
+
+from fastapi import status
+
+from app.backend.config import config
+from app.backend.ratelimit import (
+    MemoryRateLimiter,
+    RedisRateLimiter,
+)
+from app.const import AUTH_URL
+from app.services import auth
+
+
+class Client:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def eval(self, *args):
+        self.calls.append(args)
+        return self.result
+
+
+def test_token_bucket(timer):
+    limiter = MemoryRateLimiter(10, timer=timer)
+
+    def acquire(key="a"):
+        return asyncio.run(limiter.acquire(key, 2, 60))
+
+    assert acquire() == 0
+    assert acquire() == 0
+    assert acquire() == 30
+    assert acquire("b") == 0
+
+    # one token is restored in period / capacity seconds
+    timer.now = 30
+    assert acquire() == 0
+    assert acquire() == 30
+
+
+def test_redis_limiter():
+    client = Client(b"1.5")
+    limiter = RedisRateLimiter("", client=client)
+
+    assert asyncio.run(limiter.acquire("a", 2, 60)) == 1.5
+    assert client.calls[0][1:5] == (1, "a", 2, 2 / 60)
+
+
+def test_login_rate_limit(client, monkeypatch):
+    monkeypatch.setattr(auth, "login_limiter", MemoryRateLimiter(10))
+    monkeypatch.setattr(config.rate_limit, "username_attempts", 1)
+
+    data = {
+        "username": "throttled@myapi.com",
+        "password": "fake_password",
+    }
+
+    response = client.post("/" + AUTH_URL, data=data)
+    assert response.status_code != status.HTTP_429_TOO_MANY_REQUESTS
+
+    response = client.post("/" + AUTH_URL, data=data)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) > 0
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from app.backend.readers import (
+    chunked,
+    read_records,
+)
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_read_csv(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text("name,email,password\na,a@x,p\nb,b@x,q\n")
+
+    records = list(read_records(path))
+
+    assert records == [
+        {"name": "a", "email": "a@x", "password": "p"},
+        {"name": "b", "email": "b@x", "password": "q"},
+    ]
+
+
+def test_read_jsonl(tmp_path):
+    path = tmp_path / "users.txt"
+    path.write_text(json.dumps({"name": "a"}) + "\n\n" + json.dumps({"name": "b"}))
+
+    assert list(read_records(path, "jsonl")) == [{"name": "a"}, {"name": "b"}]
+
+    with pytest.raises(ValueError):
+        list(read_records(path))
@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+    Session,
+)
+
+from app.models.base import SQLModel
+from app.services.base import (
+    AsyncBaseDataManager,
+    BaseDataManager,
+    tvf_arg_types,
+    tvf_cache,
+    tvf_statement,
+)
+
+
+class JsonEachModel(SQLModel):
+    # sqlite built-in table valued function
+    __tablename__ = "json_each"
+    __table_args__ = {"schema": "main"}
+
+    key: Mapped[int] = mapped_column("key", primary_key=True)
+    value: Mapped[int] = mapped_column("value")
+
+
+def test_statement_cached():
+    stmt, params = BaseDataManager.select_from_tvf(JsonEachModel, ["[1]"])
+
+    assert stmt is BaseDataManager.select_from_tvf(JsonEachModel, ["[2]"])[0]
+    assert stmt is not BaseDataManager.select_from_tvf(JsonEachModel, [1])[0]
+    assert params == {"tvf_0": "[1]"}
+
+
+def test_statement_typed():
+    stmt = tvf_statement(JsonEachModel, tvf_arg_types([1, "a"]))
+    sql = str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+
+    assert "json_each($1::INTEGER, $2::VARCHAR)" in sql
+
+
+def test_get_and_stream_from_tvf():
+    engine = create_engine("sqlite://")
+
+    with Session(engine) as session:
+        manager = BaseDataManager(session)
+
+        models = manager.get_from_tvf(JsonEachModel, json.dumps([10, 20]))
+        assert [(m.key, m.value) for m in models] == [(0, 10), (1, 20)]
+
+        # statement is reused, arguments are bound on execution
+        models = manager.get_from_tvf(JsonEachModel, json.dumps([30]))
+        assert [(m.key, m.value) for m in models] == [(0, 30)]
+
+        stream = manager.stream_from_tvf(
+            JsonEachModel, json.dumps([1, 2, 3]), yield_per=2
+        )
+        assert [m.value for m in stream] == [1, 2, 3]
+
+
+def test_cached_from_tvf():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+
+        async with AsyncSession(engine) as session:
+            manager = AsyncBaseDataManager(session)
+            arg = json.dumps([5, 6])
+
+            rows = await manager.get_cached_from_tvf(JsonEachModel, arg, ttl=60)
+            assert rows == [{"key": 0, "value": 5}, {"key": 1, "value": 6}]
+
+            key = manager.tvf_cache_key(JsonEachModel, [arg])
+            assert await manager.get_cached_from_tvf(JsonEachModel, arg) == rows
+            assert await tvf_cache.backend.get(key) == rows
+
+            values = [
+                m.value async for m in manager.stream_from_tvf(JsonEachModel, arg)
+            ]
+            assert values == [5, 6]
+
+        await engine.dispose()
+
+    asyncio.run(run())